@@ -8,6 +8,7 @@ print("GROQ_API_KEY =", os.getenv("GROQ_API_KEY"))
 
 import streamlit as st
 import sys
+import threading
 from pathlib import Path
 
 # Add src to path
@@ -21,13 +22,36 @@ from config.settings import PAGE_CONFIG
 # Page configuration
 st.set_page_config(**PAGE_CONFIG)
 
+def _warm_groq_connection(service: InterviewService) -> None:
+    """Fire a one-token completion so the connection pool is warm before the first real call"""
+    try:
+        service.groq_service.generate_completion(prompt="ok", max_tokens=1)
+    except Exception:
+        pass  # warm-up is best-effort
+
+@st.cache_resource
+def get_interview_service() -> InterviewService:
+    """Build the service graph once per process and reuse it across reruns"""
+    service = InterviewService()
+    threading.Thread(
+        target=_warm_groq_connection,
+        args=(service,),
+        daemon=True
+    ).start()
+    return service
+
 def main():
     """Main application entry point"""
     # Initialize session state
     initialize_session_state()
-    
-    # Initialize service
-    interview_service = InterviewService()
+
+    # Initialize service. Failed constructions are not cached, so fixing
+    # the environment and rerunning recovers without a restart
+    try:
+        interview_service = get_interview_service()
+    except ValueError as e:
+        st.error(f"Failed to initialize services: {str(e)}")
+        st.stop()
     
     # Render UI
     st.title("ScoreMe — Practice. Perform. Get hired.")
@@ -1,4 +1,5 @@
 import os
+from string import Template
 from typing import Dict, Any
 
 # API Configuration
@@ -7,7 +8,7 @@ GROQ_MODEL = "llama-3.3-70b-versatile"  # Latest stable model from Groq
 GROQ_API_BASE = "https://api.groq.com/openai/v1"
 
 # Interview Configuration
-INTERVIEW_TYPES = [
+INTERVIEW_TYPES = (
     "Technical - Software Engineering",
     "Technical - Data Science",
     "Behavioral",
@@ -15,9 +16,14 @@ INTERVIEW_TYPES = [
     "Product Management",
     "Sales",
     "Customer Service"
-]
+)
 
-DIFFICULTY_LEVELS = ["Entry Level", "Mid Level", "Senior Level", "Executive"]
+DIFFICULTY_LEVELS = ("Entry Level", "Mid Level", "Senior Level", "Executive")
+
+# Value-to-position maps so widgets resolve the selected index with a
+# hash lookup instead of a linear scan on every rerun
+INTERVIEW_TYPES_INDEX = {value: index for index, value in enumerate(INTERVIEW_TYPES)}
+DIFFICULTY_LEVELS_INDEX = {value: index for index, value in enumerate(DIFFICULTY_LEVELS)}
 
 DEFAULT_NUM_QUESTIONS = 5
 
@@ -41,7 +47,17 @@ EVALUATION_CRITERIA = {
     }
 }
 
+# Token caps per call type; responses are far smaller than the client
+# default of 2048, and tighter caps trim Groq latency and billing
+QUESTION_TOKENS_PER_QUESTION = 64
+QUESTION_MAX_TOKENS = 768
+ANSWER_EVALUATION_MAX_TOKENS = 600
+AUDIO_ANALYSIS_MAX_TOKENS = 500
+
 # Audio/Video Settings
+# Face and hand tracking roughly double per-frame analysis cost; disable
+# to score posture only
+ANALYZE_FACE_AND_HANDS = True
 MAX_VIDEO_SIZE_MB = 100
 MAX_AUDIO_SIZE_MB = 25
 SUPPORTED_VIDEO_FORMATS = [".mp4", ".avi", ".mov", ".webm"]
@@ -56,7 +72,9 @@ PAGE_CONFIG: Dict[str, Any] = {
 }
 
 # Prompt Templates
-QUESTION_GENERATION_PROMPT = """You are an expert interviewer. Generate {num_questions} realistic interview questions for a {interview_type} position at {difficulty_level}.
+# Authored with $placeholders and precompiled once; Template substitution
+# skips the .format parser and needs no {{ }} escaping around JSON braces.
+QUESTION_GENERATION_TEMPLATE = Template("""You are an expert interviewer. Generate $num_questions realistic interview questions for a $interview_type position at $difficulty_level.
 
 Requirements:
 - Questions should be realistic and commonly asked in actual interviews
@@ -64,14 +82,14 @@ Requirements:
 - Include a mix of question types (technical, behavioral, situational as appropriate)
 - Format as a numbered list
 
-Generate the questions now:"""
+Generate the questions now:""")
 
-ANSWER_EVALUATION_PROMPT = """You are an expert interview evaluator. Evaluate the following interview response:
+ANSWER_EVALUATION_TEMPLATE = Template("""You are an expert interview evaluator. Evaluate the following interview response:
 
-Question: {question}
-Candidate's Answer: {answer}
-Interview Type: {interview_type}
-Level: {difficulty_level}
+Question: $question
+Candidate's Answer: $answer
+Interview Type: $interview_type
+Level: $difficulty_level
 
 Evaluate on these criteria:
 1. Content Quality (35%): Accuracy, relevance, depth
@@ -88,29 +106,29 @@ Provide:
 6. One specific actionable tip
 
 Format your response as JSON:
-{{
-    "scores": {{
+{
+    "scores": {
         "content_quality": <score>,
         "communication": <score>,
         "confidence": <score>,
         "overall_impression": <score>
-    }},
-    "feedback": {{
+    },
+    "feedback": {
         "content_quality": "<feedback>",
         "communication": "<feedback>",
         "confidence": "<feedback>",
         "overall_impression": "<feedback>"
-    }},
+    },
     "overall_score": <weighted_score>,
     "strengths": ["<strength1>", "<strength2>", "<strength3>"],
     "improvements": ["<improvement1>", "<improvement2>", "<improvement3>"],
     "actionable_tip": "<specific tip>"
-}}"""
+}""")
 
-VIDEO_ANALYSIS_PROMPT = """You are analyzing a candidate's body language and non-verbal communication during an interview response.
+VIDEO_ANALYSIS_TEMPLATE = Template("""You are analyzing a candidate's body language and non-verbal communication during an interview response.
 
 Based on the video analysis data provided:
-{video_analysis_data}
+$video_analysis_data
 
 Evaluate the candidate's:
 1. Posture and body positioning
@@ -121,18 +139,18 @@ Evaluate the candidate's:
 Provide a body language score (0-100) and specific feedback on what was observed (both positive and negative).
 
 Format as JSON:
-{{
+{
     "body_language_score": <score>,
     "posture_feedback": "<feedback>",
     "facial_expression_feedback": "<feedback>",
     "gesture_feedback": "<feedback>",
     "overall_presence": "<feedback>"
-}}"""
+}""")
 
-AUDIO_ANALYSIS_PROMPT = """Analyze the audio characteristics of this interview response:
+AUDIO_ANALYSIS_TEMPLATE = Template("""Analyze the audio characteristics of this interview response:
 
-Transcript: {transcript}
-Interview Type: {interview_type}
+Transcript: $transcript
+Interview Type: $interview_type
 
 Evaluate:
 1. Speaking pace and rhythm
@@ -144,14 +162,14 @@ Evaluate:
 Provide detailed feedback on vocal delivery and communication effectiveness.
 
 Format as JSON:
-{{
+{
     "vocal_score": <score>,
     "pace_feedback": "<feedback>",
     "clarity_feedback": "<feedback>",
-    "filler_words": {{
+    "filler_words": {
         "count": <number>,
         "feedback": "<feedback>"
-    }},
+    },
     "tone_feedback": "<feedback>",
     "professional_delivery": "<feedback>"
-}}"""
+}""")
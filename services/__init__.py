@@ -1,13 +1,16 @@
 """Services package for Mock Interview Evaluator"""
 
 from .groq_service import GroqService
-from .evaluation_service import EvaluationService
+from .evaluation_service import EvaluationService, InterviewContext
 from .interview_service import InterviewService
-from .media_processor import MediaProcessor
+
+# MediaProcessor is intentionally not imported here: it pulls in heavy
+# media libraries (OpenCV, MediaPipe) that text-only flows never need.
+# Import it from services.media_processor where required.
 
 __all__ = [
     'GroqService',
     'EvaluationService',
-    'InterviewService',
-    'MediaProcessor'
+    'InterviewContext',
+    'InterviewService'
 ]
\ No newline at end of file
@@ -1,18 +1,143 @@
-from typing import Dict, Any, Optional
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+import numpy as np
 from services.groq_service import GroqService
 from config.settings import (
-    ANSWER_EVALUATION_PROMPT,
-    VIDEO_ANALYSIS_PROMPT,
-    AUDIO_ANALYSIS_PROMPT
+    ANSWER_EVALUATION_TEMPLATE,
+    AUDIO_ANALYSIS_TEMPLATE,
+    ANSWER_EVALUATION_MAX_TOKENS,
+    AUDIO_ANALYSIS_MAX_TOKENS
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class InterviewContext:
+    """Immutable interview configuration threaded through evaluation calls"""
+    interview_type: str
+    difficulty_level: str
+
+
+# Cap concurrent Groq requests so batch fanout stays within rate limits
+MAX_CONCURRENT_EVALUATIONS = 8
+
+# Overall score weights: content, communication, body language, vocal
+_SCORE_WEIGHTS = np.array([0.35, 0.25, 0.20, 0.20], dtype=np.float32)
+
+# Shape the evaluator prompt asks the model to produce
+_EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {"type": "object"},
+        "feedback": {"type": "object"},
+        "overall_score": {"type": "number"},
+        "strengths": {"type": "array"},
+        "improvements": {"type": "array"},
+        "actionable_tip": {"type": "string"}
+    },
+    "required": ["scores", "feedback", "overall_score"]
+}
+
+# Compile the schema validator once at import if fastjsonschema is installed
+try:
+    import fastjsonschema
+    _validate_evaluation_schema = fastjsonschema.compile(_EVALUATION_SCHEMA)
+except ImportError:
+    _validate_evaluation_schema = None
+    logger.warning("fastjsonschema not available. Evaluation schema validation disabled.")
+
+
+def is_fallback_evaluation(evaluation: Dict[str, Any]) -> bool:
+    """True when an evaluation is the canned technical-error fallback"""
+    return evaluation == _FALLBACK_EVALUATION
+
+
+def _is_valid_evaluation(evaluation: Dict[str, Any]) -> bool:
+    """Check whether an evaluator response matches the expected shape"""
+    if not isinstance(evaluation, dict) or "error" in evaluation:
+        return False
+
+    if _validate_evaluation_schema is None:
+        return True
+
+    try:
+        _validate_evaluation_schema(evaluation)
+        return True
+    except fastjsonschema.JsonSchemaException as e:
+        logger.warning(f"Evaluation failed schema validation: {str(e)}")
+        return False
+
+
+# Answers shorter than this skip the Groq round-trip entirely
+_MIN_EVALUABLE_LENGTH = 10
+
+# Returned for empty or near-empty answers without calling Groq
+_TRIVIAL_ANSWER_EVALUATION: Dict[str, Any] = {
+    "scores": {
+        "content_quality": 10,
+        "communication": 10,
+        "confidence": 10,
+        "overall_impression": 10
+    },
+    "feedback": {
+        "content_quality": "The answer is too short to evaluate meaningfully.",
+        "communication": "There is not enough content to assess communication.",
+        "confidence": "A substantive answer is needed to assess confidence.",
+        "overall_impression": "Please provide a complete answer."
+    },
+    "overall_score": 10,
+    "strengths": ["You submitted a response"],
+    "improvements": ["Provide a full answer with specific details and examples"],
+    "actionable_tip": "Aim for at least a few sentences that directly address the question."
+}
+
+_TRIVIAL_AUDIO_EVALUATION: Dict[str, Any] = {
+    "vocal_score": 10,
+    "pace_feedback": "No evaluable speech was detected.",
+    "clarity_feedback": "The transcript is too short to assess clarity.",
+    "filler_words": {"count": 0, "feedback": "N/A"},
+    "tone_feedback": "The transcript is too short to assess tone.",
+    "professional_delivery": "Please record a complete spoken answer."
+}
+
+# Fallback payloads built once at import; callers get shallow copies
+_FALLBACK_EVALUATION: Dict[str, Any] = {
+    "scores": {
+        "content_quality": 70,
+        "communication": 70,
+        "confidence": 70,
+        "overall_impression": 70
+    },
+    "feedback": {
+        "content_quality": "Unable to evaluate due to technical error.",
+        "communication": "Unable to evaluate due to technical error.",
+        "confidence": "Unable to evaluate due to technical error.",
+        "overall_impression": "Please try again."
+    },
+    "overall_score": 70,
+    "strengths": ["Response recorded successfully"],
+    "improvements": ["Please try submitting again for detailed feedback"],
+    "actionable_tip": "Ensure your response is clear and detailed."
+}
+
+_FALLBACK_AUDIO_EVALUATION: Dict[str, Any] = {
+    "vocal_score": 75,
+    "pace_feedback": "Unable to analyze audio quality.",
+    "clarity_feedback": "Audio analysis unavailable.",
+    "filler_words": {"count": 0, "feedback": "N/A"},
+    "tone_feedback": "Audio analysis unavailable.",
+    "professional_delivery": "Please ensure clear audio recording."
+}
+
+
 class EvaluationService:
     """Service for evaluating interview responses"""
-    
+
+    __slots__ = ('groq_service',)
+
     def __init__(self, groq_service: GroqService):
         self.groq_service = groq_service
     
@@ -20,16 +145,18 @@ class EvaluationService:
         self,
         question: str,
         answer: str,
-        interview_type: str,
-        difficulty_level: str
+        context: InterviewContext
     ) -> Dict[str, Any]:
         """Evaluate a text answer"""
+        if not answer or len(answer.strip()) < _MIN_EVALUABLE_LENGTH:
+            return dict(_TRIVIAL_ANSWER_EVALUATION)
+
         try:
-            prompt = ANSWER_EVALUATION_PROMPT.format(
+            prompt = ANSWER_EVALUATION_TEMPLATE.safe_substitute(
                 question=question,
                 answer=answer,
-                interview_type=interview_type,
-                difficulty_level=difficulty_level
+                interview_type=context.interview_type,
+                difficulty_level=context.difficulty_level
             )
             
             system_message = "You are an expert interview evaluator. Provide honest, constructive feedback."
@@ -37,15 +164,98 @@ class EvaluationService:
             evaluation = self.groq_service.generate_json_completion(
                 prompt=prompt,
                 temperature=0.6,
+                max_tokens=ANSWER_EVALUATION_MAX_TOKENS,
                 system_message=system_message
             )
-            
+
+            # Retry once at lower temperature if the response is malformed
+            if not _is_valid_evaluation(evaluation):
+                logger.warning("Malformed evaluation response, retrying once")
+                evaluation = self.groq_service.generate_json_completion(
+                    prompt=prompt,
+                    temperature=0.5,
+                    max_tokens=ANSWER_EVALUATION_MAX_TOKENS,
+                    system_message=system_message
+                )
+
+                if not _is_valid_evaluation(evaluation):
+                    return self._get_fallback_evaluation()
+
             return evaluation
         
         except Exception as e:
             logger.error(f"Error evaluating answer: {str(e)}")
             return self._get_fallback_evaluation()
-    
+
+    async def a_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        context: InterviewContext
+    ) -> Dict[str, Any]:
+        """Evaluate a text answer asynchronously"""
+        if not answer or len(answer.strip()) < _MIN_EVALUABLE_LENGTH:
+            return dict(_TRIVIAL_ANSWER_EVALUATION)
+
+        try:
+            prompt = ANSWER_EVALUATION_TEMPLATE.safe_substitute(
+                question=question,
+                answer=answer,
+                interview_type=context.interview_type,
+                difficulty_level=context.difficulty_level
+            )
+
+            system_message = "You are an expert interview evaluator. Provide honest, constructive feedback."
+
+            evaluation = await self.groq_service.agenerate_json_completion(
+                prompt=prompt,
+                temperature=0.6,
+                max_tokens=ANSWER_EVALUATION_MAX_TOKENS,
+                system_message=system_message
+            )
+
+            # Retry once at lower temperature if the response is malformed
+            if not _is_valid_evaluation(evaluation):
+                logger.warning("Malformed evaluation response, retrying once")
+                evaluation = await self.groq_service.agenerate_json_completion(
+                    prompt=prompt,
+                    temperature=0.5,
+                    max_tokens=ANSWER_EVALUATION_MAX_TOKENS,
+                    system_message=system_message
+                )
+
+                if not _is_valid_evaluation(evaluation):
+                    return self._get_fallback_evaluation()
+
+            return evaluation
+
+        except Exception as e:
+            logger.error(f"Error evaluating answer: {str(e)}")
+            return self._get_fallback_evaluation()
+
+    async def a_evaluate_batch(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Evaluate a batch of answers concurrently against Groq
+
+        Each item is a dict with question, answer, interview_type and
+        difficulty_level keys. Results are returned in input order;
+        failures come back as exceptions rather than aborting the batch.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+
+        async def evaluate_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.a_evaluate_answer(
+                    question=item["question"],
+                    answer=item["answer"],
+                    context=InterviewContext(
+                        interview_type=item["interview_type"],
+                        difficulty_level=item["difficulty_level"]
+                    )
+                )
+
+        tasks = [evaluate_one(item) for item in items]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def evaluate_video(
         self,
         video_analysis_data: Dict[str, Any]
@@ -82,13 +292,16 @@ class EvaluationService:
     def evaluate_audio(
         self,
         transcript: str,
-        interview_type: str
+        context: InterviewContext
     ) -> Dict[str, Any]:
         """Evaluate vocal delivery from audio"""
+        if not transcript or len(transcript.strip()) < _MIN_EVALUABLE_LENGTH:
+            return dict(_TRIVIAL_AUDIO_EVALUATION)
+
         try:
-            prompt = AUDIO_ANALYSIS_PROMPT.format(
+            prompt = AUDIO_ANALYSIS_TEMPLATE.safe_substitute(
                 transcript=transcript,
-                interview_type=interview_type
+                interview_type=context.interview_type
             )
             
             system_message = "You are a speech and communication expert."
@@ -96,6 +309,7 @@ class EvaluationService:
             audio_eval = self.groq_service.generate_json_completion(
                 prompt=prompt,
                 temperature=0.5,
+                max_tokens=AUDIO_ANALYSIS_MAX_TOKENS,
                 system_message=system_message
             )
             
@@ -103,15 +317,38 @@ class EvaluationService:
         
         except Exception as e:
             logger.error(f"Error evaluating audio: {str(e)}")
-            return {
-                "vocal_score": 75,
-                "pace_feedback": "Unable to analyze audio quality.",
-                "clarity_feedback": "Audio analysis unavailable.",
-                "filler_words": {"count": 0, "feedback": "N/A"},
-                "tone_feedback": "Audio analysis unavailable.",
-                "professional_delivery": "Please ensure clear audio recording."
-            }
-    
+            return self._get_fallback_audio_evaluation()
+
+    async def a_evaluate_audio(
+        self,
+        transcript: str,
+        context: InterviewContext
+    ) -> Dict[str, Any]:
+        """Evaluate vocal delivery from audio asynchronously"""
+        if not transcript or len(transcript.strip()) < _MIN_EVALUABLE_LENGTH:
+            return dict(_TRIVIAL_AUDIO_EVALUATION)
+
+        try:
+            prompt = AUDIO_ANALYSIS_TEMPLATE.safe_substitute(
+                transcript=transcript,
+                interview_type=context.interview_type
+            )
+
+            system_message = "You are a speech and communication expert."
+
+            audio_eval = await self.groq_service.agenerate_json_completion(
+                prompt=prompt,
+                temperature=0.5,
+                max_tokens=AUDIO_ANALYSIS_MAX_TOKENS,
+                system_message=system_message
+            )
+
+            return audio_eval
+
+        except Exception as e:
+            logger.error(f"Error evaluating audio: {str(e)}")
+            return self._get_fallback_audio_evaluation()
+
     def calculate_overall_score(
         self,
         content_score: float,
@@ -120,39 +357,25 @@ class EvaluationService:
         vocal_score: float
     ) -> float:
         """Calculate weighted overall score"""
-        weights = {
-            "content": 0.35,
-            "communication": 0.25,
-            "body_language": 0.20,
-            "vocal": 0.20
-        }
-        
-        overall = (
-            content_score * weights["content"] +
-            communication_score * weights["communication"] +
-            body_language_score * weights["body_language"] +
-            vocal_score * weights["vocal"]
+        overall = np.dot(
+            _SCORE_WEIGHTS,
+            (content_score, communication_score, body_language_score, vocal_score)
         )
-        
-        return round(overall, 1)
+
+        return round(float(overall), 1)
+
+    def calculate_overall_scores(self, score_matrix: np.ndarray) -> np.ndarray:
+        """Calculate weighted overall scores for a batch of evaluations
+
+        Each row of score_matrix holds (content, communication,
+        body_language, vocal) scores; returns one overall score per row.
+        """
+        return np.round(np.asarray(score_matrix, dtype=np.float32) @ _SCORE_WEIGHTS, 1)
     
+    def _get_fallback_audio_evaluation(self) -> Dict[str, Any]:
+        """Return fallback audio evaluation if API fails"""
+        return dict(_FALLBACK_AUDIO_EVALUATION)
+
     def _get_fallback_evaluation(self) -> Dict[str, Any]:
         """Return fallback evaluation if API fails"""
-        return {
-            "scores": {
-                "content_quality": 70,
-                "communication": 70,
-                "confidence": 70,
-                "overall_impression": 70
-            },
-            "feedback": {
-                "content_quality": "Unable to evaluate due to technical error.",
-                "communication": "Unable to evaluate due to technical error.",
-                "confidence": "Unable to evaluate due to technical error.",
-                "overall_impression": "Please try again."
-            },
-            "overall_score": 70,
-            "strengths": ["Response recorded successfully"],
-            "improvements": ["Please try submitting again for detailed feedback"],
-            "actionable_tip": "Ensure your response is clear and detailed."
-        }
\ No newline at end of file
+        return dict(_FALLBACK_EVALUATION)
\ No newline at end of file
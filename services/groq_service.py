@@ -1,89 +1,232 @@
+import asyncio
+import importlib.util
 import json
-from typing import Dict, Any, List, Optional
-from groq import Groq
+import re
+import weakref
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
+import httpx
+from groq import Groq, AsyncGroq, APIConnectionError, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 from config.settings import GROQ_API_KEY, GROQ_MODEL
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer orjson's Rust parser when available; it raises a subclass of
+# json.JSONDecodeError, so the existing error handling is unchanged
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+    logger.warning("orjson not available. Falling back to stdlib json parsing.")
+
+# Matches numbered list lines like "1. Question" or "2) Question"
+_QUESTION_RE = re.compile(r'^\s*\d{1,3}[.)]\s*(.+)$')
+
+
+def _question_max_tokens(num_questions: int) -> int:
+    """Token cap scaled to how many questions were requested"""
+    from config.settings import QUESTION_TOKENS_PER_QUESTION, QUESTION_MAX_TOKENS
+    return min(QUESTION_TOKENS_PER_QUESTION * num_questions, QUESTION_MAX_TOKENS)
+
+# Back off and retry transient Groq failures (429s, dropped connections)
+# so a concurrent evaluation fanout doesn't lose the whole batch
+_groq_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=0.5, max=10),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    reraise=True
+)
+
+# Pool sized for concurrent evaluation fanout; HTTP/2 needs the optional h2 package
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+_HTTP_TIMEOUT = 30.0
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> Groq:
+    """Share one Groq client (and its keep-alive pool) per API key"""
+    return Groq(
+        api_key=api_key,
+        http_client=httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+            timeout=_HTTP_TIMEOUT
+        )
+    )
+
 
 class GroqService:
     """Service for interacting with Groq API"""
-    
+
+    __slots__ = ('api_key', 'client', '_async_clients', 'model')
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Groq client"""
         self.api_key = api_key or GROQ_API_KEY
         if not self.api_key:
             raise ValueError("GROQ_API_KEY is required. Set it in environment variables.")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = _get_client(self.api_key)
+        self._async_clients = weakref.WeakKeyDictionary()
         self.model = GROQ_MODEL
         logger.info(f"Initialized GroqService with model: {self.model}")
+
+    @property
+    def async_client(self) -> AsyncGroq:
+        """Async Groq client bound to the running event loop
+
+        Media evaluations drive the async path through asyncio.run, which
+        closes its loop when it returns; an httpx pool created under one
+        loop hands out dead keep-alive connections under the next. Cache
+        one client per loop (weakly, so finished loops are collected)
+        instead of sharing one process-wide.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+
+        if client is None:
+            client = AsyncGroq(
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=_HTTP_LIMITS,
+                    timeout=_HTTP_TIMEOUT
+                )
+            )
+            self._async_clients[loop] = client
+
+        return client
+
+    @staticmethod
+    def _build_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        """Build the chat message list for a completion request"""
+        messages = []
+
+        if system_message:
+            messages.append({
+                "role": "system",
+                "content": system_message
+            })
+
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+
+        return messages
     
+    @_groq_retry
     def generate_completion(
         self,
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 2048,
-        system_message: Optional[str] = None
+        system_message: Optional[str] = None,
+        response_format: Optional[Dict[str, str]] = None
     ) -> str:
         """Generate a completion from Groq API"""
         try:
-            messages = []
-            
-            if system_message:
-                messages.append({
-                    "role": "system",
-                    "content": system_message
-                })
-            
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+            messages = self._build_messages(prompt, system_message)
+
+            request_kwargs = {
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            }
+            if response_format is not None:
+                request_kwargs["response_format"] = response_format
+
+            response = self.client.chat.completions.create(**request_kwargs)
             
-            response = self.client.chat.completions.create(
+            return response.choices[0].message.content.strip()
+        
+        except Exception as e:
+            logger.error(f"Error generating completion: {str(e)}")
+            raise
+
+    @_groq_retry
+    async def agenerate_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        system_message: Optional[str] = None,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate a completion from Groq API asynchronously"""
+        try:
+            messages = self._build_messages(prompt, system_message)
+
+            request_kwargs = {
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            }
+            if response_format is not None:
+                request_kwargs["response_format"] = response_format
+
+            response = await self.async_client.chat.completions.create(**request_kwargs)
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            logger.error(f"Error generating async completion: {str(e)}")
+            raise
+
+    def stream_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        system_message: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream a completion from Groq API chunk by chunk"""
+        try:
+            messages = self._build_messages(prompt, system_message)
+
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                stream=True
             )
-            
-            return response.choices[0].message.content.strip()
-        
+
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+
         except Exception as e:
-            logger.error(f"Error generating completion: {str(e)}")
+            logger.error(f"Error streaming completion: {str(e)}")
             raise
-    
+
     def generate_json_completion(
         self,
         prompt: str,
         temperature: float = 0.5,
-        max_tokens: int = 2048,
+        max_tokens: int = 1024,
         system_message: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Generate a JSON completion from Groq API"""
+        """Generate a JSON completion from Groq API using native JSON mode"""
         try:
             response_text = self.generate_completion(
                 prompt=prompt,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                system_message=system_message
+                system_message=system_message,
+                response_format={"type": "json_object"}
             )
-            
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            
-            return json.loads(response_text)
-        
+
+            return _loads(response_text)
+
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing JSON response: {str(e)}")
             logger.error(f"Response text: {response_text}")
@@ -94,7 +237,37 @@ class GroqService:
         except Exception as e:
             logger.error(f"Error generating JSON completion: {str(e)}")
             raise
-    
+
+    async def agenerate_json_completion(
+        self,
+        prompt: str,
+        temperature: float = 0.5,
+        max_tokens: int = 1024,
+        system_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate a JSON completion from Groq API asynchronously using native JSON mode"""
+        try:
+            response_text = await self.agenerate_completion(
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_message=system_message,
+                response_format={"type": "json_object"}
+            )
+
+            return _loads(response_text)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON response: {str(e)}")
+            logger.error(f"Response text: {response_text}")
+            return {
+                "error": "Failed to parse JSON response",
+                "raw_response": response_text
+            }
+        except Exception as e:
+            logger.error(f"Error generating async JSON completion: {str(e)}")
+            raise
+
     def generate_questions(
         self,
         interview_type: str,
@@ -102,28 +275,63 @@ class GroqService:
         num_questions: int
     ) -> List[str]:
         """Generate interview questions"""
-        from config.settings import QUESTION_GENERATION_PROMPT
-        
-        prompt = QUESTION_GENERATION_PROMPT.format(
-            num_questions=num_questions,
-            interview_type=interview_type,
-            difficulty_level=difficulty_level
+        prompt, system_message = self._build_question_request(
+            interview_type, difficulty_level, num_questions
         )
-        
-        system_message = "You are an expert technical and behavioral interviewer with years of experience."
-        
+
         response = self.generate_completion(
             prompt=prompt,
             temperature=0.8,
+            max_tokens=_question_max_tokens(num_questions),
             system_message=system_message
         )
-        
+
+        return self.parse_questions(response, num_questions)
+
+    def stream_questions(
+        self,
+        interview_type: str,
+        difficulty_level: str,
+        num_questions: int
+    ) -> Iterator[str]:
+        """Stream the question-generation response as it is produced"""
+        prompt, system_message = self._build_question_request(
+            interview_type, difficulty_level, num_questions
+        )
+
+        return self.stream_completion(
+            prompt=prompt,
+            temperature=0.8,
+            max_tokens=_question_max_tokens(num_questions),
+            system_message=system_message
+        )
+
+    @staticmethod
+    def _build_question_request(
+        interview_type: str,
+        difficulty_level: str,
+        num_questions: int
+    ) -> tuple:
+        """Build the prompt and system message for question generation"""
+        from config.settings import QUESTION_GENERATION_TEMPLATE
+
+        prompt = QUESTION_GENERATION_TEMPLATE.safe_substitute(
+            num_questions=num_questions,
+            interview_type=interview_type,
+            difficulty_level=difficulty_level
+        )
+
+        system_message = "You are an expert technical and behavioral interviewer with years of experience."
+
+        return prompt, system_message
+
+    @staticmethod
+    def parse_questions(response: str, num_questions: int) -> List[str]:
+        """Parse a numbered-list response into individual questions"""
         questions = []
-        for line in response.split('\n'):
-            line = line.strip()
-            if line and any(line.startswith(f"{i}.") or line.startswith(f"{i})") for i in range(1, 100)):
-                question = line.split('.', 1)[-1].split(')', 1)[-1].strip()
-                if question:
-                    questions.append(question)
-        
+        for line in response.splitlines():
+            match = _QUESTION_RE.match(line)
+            if match:
+                questions.append(match.group(1).strip())
+
         return questions[:num_questions]
\ No newline at end of file
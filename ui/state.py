@@ -1,46 +1,84 @@
+import copy
 import streamlit as st
+from enum import IntEnum
 from typing import List, Dict, Any
-
-
-def initialize_session_state():
-    """Initialize all session state variables"""
-    
+from utils.helpers import merge_dicts
+
+
+class EvalKind(IntEnum):
+    """Integer dispatch key stored on evaluation payloads at ingestion"""
+    TEXT = 0
+    AUDIO = 1
+    VIDEO = 2
+
+
+_EVAL_KINDS = {"text": EvalKind.TEXT, "audio": EvalKind.AUDIO, "video": EvalKind.VIDEO}
+
+# Defaults merged into evaluation payloads at ingestion, so render code
+# reads fields directly instead of re-applying .get fallbacks on every
+# rerun of every completed question
+_SCORE_DEFAULTS = {
+    "content_quality": 0,
+    "communication": 0,
+    "confidence": 0,
+    "overall_impression": 0
+}
+
+_TEXT_EVAL_DEFAULTS = {
+    "overall_score": 0,
+    "feedback": {},
+    "strengths": [],
+    "improvements": [],
+    "actionable_tip": "Keep practicing!"
+}
+
+_VOCAL_EVAL_DEFAULTS = {
+    "vocal_score": 0,
+    "pace_feedback": "N/A",
+    "clarity_feedback": "N/A",
+    "tone_feedback": "N/A",
+    "professional_delivery": "N/A"
+}
+
+_FILLER_WORDS_DEFAULTS = {"count": 0, "feedback": "N/A"}
+
+_BODY_EVAL_DEFAULTS = {
+    "body_language_score": 0,
+    "posture_feedback": "N/A",
+    "facial_expression_feedback": "N/A",
+    "gesture_feedback": "N/A",
+    "overall_presence": "N/A"
+}
+
+# Session defaults applied on every rerun; a single setdefault probe per
+# key replaces the old ladder of membership checks plus assignments
+_SESSION_DEFAULTS = {
     # Interview configuration
-    if "interview_type" not in st.session_state:
-        st.session_state.interview_type = "Technical - Software Engineering"
-    
-    if "difficulty_level" not in st.session_state:
-        st.session_state.difficulty_level = "Mid Level"
-    
-    if "num_questions" not in st.session_state:
-        st.session_state.num_questions = 5
-    
+    "interview_type": "Technical - Software Engineering",
+    "difficulty_level": "Mid Level",
+    "num_questions": 5,
     # Interview state
-    if "questions" not in st.session_state:
-        st.session_state.questions = []
-    
-    if "current_question_index" not in st.session_state:
-        st.session_state.current_question_index = 0
-    
-    if "interview_started" not in st.session_state:
-        st.session_state.interview_started = False
-    
-    if "interview_completed" not in st.session_state:
-        st.session_state.interview_completed = False
-    
+    "questions": [],
+    "current_question_index": 0,
+    "interview_started": False,
+    "interview_completed": False,
     # Responses and evaluations
-    if "responses" not in st.session_state:
-        st.session_state.responses = []
-    
-    if "evaluations" not in st.session_state:
-        st.session_state.evaluations = []
-    
+    "responses": [],
+    "evaluations": {},
     # UI state
-    if "processing" not in st.session_state:
-        st.session_state.processing = False
-    
-    if "response_mode" not in st.session_state:
-        st.session_state.response_mode = "Text"
+    "processing": False,
+    "response_mode": "Text"
+}
+
+
+def initialize_session_state():
+    """Initialize all session state variables"""
+    for key, value in _SESSION_DEFAULTS.items():
+        # Copy mutable defaults so sessions never alias the shared dict
+        st.session_state.setdefault(
+            key,
+            copy.copy(value) if isinstance(value, (list, dict)) else value
+        )
 
 
 def reset_interview():
@@ -50,44 +88,101 @@ def reset_interview():
     st.session_state.interview_started = False
     st.session_state.interview_completed = False
     st.session_state.responses = []
-    st.session_state.evaluations = []
+    st.session_state.evaluations = {}
     st.session_state.processing = False
+    st.session_state.results_celebrated = False
 
 
 def start_interview(questions: List[str]):
     """Start the interview with generated questions"""
-    st.session_state.questions = questions
+    # Tuples are immutable and slightly cheaper to index; downstream
+    # code only ever reads the question list
+    st.session_state.questions = tuple(questions)
     st.session_state.interview_started = True
     st.session_state.current_question_index = 0
     st.session_state.responses = []
-    st.session_state.evaluations = []
+    st.session_state.evaluations = {}
     st.session_state.interview_completed = False
+    st.session_state.results_celebrated = False
 
 
 def next_question():
     """Move to next question"""
-    if st.session_state.current_question_index < len(st.session_state.questions) - 1:
-        st.session_state.current_question_index += 1
-    else:
+    index = st.session_state.current_question_index
+    last = len(st.session_state.questions) - 1
+
+    # Write session state only on an actual transition; assignments
+    # trigger Streamlit's reactivity even when the value is unchanged
+    if index < last:
+        st.session_state.current_question_index = index + 1
+    elif not st.session_state.interview_completed:
         st.session_state.interview_completed = True
 
 
 def previous_question():
     """Move to previous question"""
-    if st.session_state.current_question_index > 0:
-        st.session_state.current_question_index -= 1
+    index = st.session_state.current_question_index
+    if index > 0:
+        st.session_state.current_question_index = index - 1
+
+
+def _normalize_text_eval(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill missing text-evaluation fields with defaults"""
+    merged = merge_dicts(_TEXT_EVAL_DEFAULTS, payload or {})
+    merged["scores"] = merge_dicts(_SCORE_DEFAULTS, merged.get("scores") or {})
+    return merged
+
+
+def _normalize_vocal_eval(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill missing vocal-evaluation fields with defaults"""
+    merged = merge_dicts(_VOCAL_EVAL_DEFAULTS, payload or {})
+    merged["filler_words"] = merge_dicts(_FILLER_WORDS_DEFAULTS, merged.get("filler_words") or {})
+    return merged
+
+
+def normalize_evaluation(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply render defaults to an evaluation payload once, at ingestion"""
+    normalized = dict(evaluation)
+    normalized.setdefault("question", "")
+    # Integer kind alongside the string type: renderers dispatch on it
+    # with one indexed call instead of chained string comparisons
+    normalized["kind"] = _EVAL_KINDS[normalized["type"]]
+
+    if normalized["type"] == "text":
+        normalized["evaluation"] = _normalize_text_eval(normalized.get("evaluation"))
+    else:
+        normalized.setdefault("transcript", "")
+        normalized["content_evaluation"] = _normalize_text_eval(normalized.get("content_evaluation"))
+        normalized["vocal_evaluation"] = _normalize_vocal_eval(normalized.get("vocal_evaluation"))
+
+        if normalized["type"] == "video":
+            normalized["body_language_evaluation"] = merge_dicts(
+                _BODY_EVAL_DEFAULTS,
+                normalized.get("body_language_evaluation") or {}
+            )
+
+    return normalized
+
 
+def add_evaluation(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Add evaluation to session state, returning the normalized payload
 
-def add_evaluation(evaluation: Dict[str, Any]):
-    """Add evaluation to session state"""
-    st.session_state.evaluations.append(evaluation)
+    Evaluations are keyed by question index, so re-answering a question
+    replaces its entry instead of appending a duplicate: memory stays
+    bounded by the interview length and every answered question keeps
+    exactly one evaluation on the results screen.
+    """
+    normalized = normalize_evaluation(evaluation)
+    st.session_state.evaluations[st.session_state.current_question_index] = normalized
+    return normalized
 
 
 def get_current_question() -> str:
     """Get current question"""
-    if st.session_state.questions and st.session_state.current_question_index < len(st.session_state.questions):
-        return st.session_state.questions[st.session_state.current_question_index]
-    return ""
+    # Read the proxy attributes once; each access is a dict lookup
+    questions = st.session_state.questions
+    index = st.session_state.current_question_index
+    return questions[index] if index < len(questions) else ""
 
 
 def get_progress() -> tuple: